@@ -21,6 +21,7 @@ import numpy as np
 class ColorMap:
     """Records colors assigned to value ranges (where Value is the start of the range)."""
 
+    __slots__ = ("_values", "_name")
     _attribute_map = {"File name": "name"}
 
     def __init__(self, **kwargs):
@@ -95,8 +95,8 @@ class Data(Entity):
     def association(self, value: str | DataAssociationEnum):
         if isinstance(value, str):
 
-            assert value.upper() in list(
-                DataAssociationEnum.__members__.keys()
+            assert (
+                value.upper() in DataAssociationEnum.__members__
             ), f"Association flag should be one of {list(DataAssociationEnum.__members__.keys())}"
 
             self._association = getattr(DataAssociationEnum, value.upper())
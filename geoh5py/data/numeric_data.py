@@ -38,7 +38,7 @@ class NumericData(Data, ABC):
         """
         :return: values: An array of float values
         """
-        if (getattr(self, "_values", None) is None) and self.existing_h5_entity:
+        if self._values is None and self.existing_h5_entity:
             self._values = self.workspace.fetch_values(self.uid)
 
         if self._values is not None:
@@ -59,7 +59,7 @@ class NumericData(Data, ABC):
         if self.n_values is not None and (
             values is None or len(values) < self.n_values
         ):
-            full_vector = np.ones(self.n_values) * np.nan
+            full_vector = np.full(self.n_values, np.nan)
             full_vector[: len(np.ravel(values))] = np.ravel(values)
 
             return full_vector
@@ -86,24 +86,26 @@ class H5Reader:
             for key, value in entity.attrs.items():
                 attributes["entity"][key] = value
 
-            for key, value in entity["Type"].attrs.items():
+            type_handle = entity["Type"]
+            for key, value in type_handle.attrs.items():
                 type_attributes["entity_type"][key] = value
 
-            if "Color map" in entity["Type"].keys():
+            if "Color map" in type_handle.keys():
                 type_attributes["entity_type"]["color_map"] = {}
-                for key, value in entity["Type"]["Color map"].attrs.items():
+                for key, value in type_handle["Color map"].attrs.items():
                     type_attributes["entity_type"]["color_map"][key] = value
-                type_attributes["entity_type"]["color_map"]["values"] = entity["Type"][
+                type_attributes["entity_type"]["color_map"]["values"] = type_handle[
                     "Color map"
                 ][:]
 
-            if "Value map" in entity["Type"].keys():
-                mapping = cls.fetch_value_map(file, uid)
+            # Read the sub-groups through the opened handle
+            if "Value map" in type_handle.keys():
+                mapping = cls.fetch_value_map(h5file, uid)
                 type_attributes["entity_type"]["value_map"] = mapping
 
             # Check if the entity has property_group
             if "PropertyGroups" in entity.keys():
-                property_groups = cls.fetch_property_groups(file, uid)
+                property_groups = cls.fetch_property_groups(h5file, uid)
 
             attributes["entity"]["existing_h5_entity"] = True
 
@@ -42,6 +42,11 @@ class H5Writer:
 
     str_type = h5py.special_dtype(vlen=str)
 
+    # Datasets smaller than this are stored contiguous and uncompressed
+    chunk_threshold = 64 * 1024
+    # Targeted size of the chunks for larger, compressed datasets
+    chunk_bytes = 1024 * 1024
+
     key_map = {
         "values": "Data",
         "cells": "Cells",
@@ -95,10 +100,19 @@ class H5Writer:
         :param dataset: Array of values to be written
         :param label: Name of the dataset on file
         """
+        if dataset.nbytes < cls.chunk_threshold:
+            entity_handle.create_dataset(label, data=dataset, dtype=dataset.dtype)
+            return
+
+        row_bytes = max(dataset.nbytes // dataset.shape[0], 1)
+        chunks = (
+            min(max(cls.chunk_bytes // row_bytes, 1), dataset.shape[0]),
+        ) + dataset.shape[1:]
         entity_handle.create_dataset(
             label,
             data=dataset,
             dtype=dataset.dtype,
+            chunks=chunks,
             compression="gzip",
             compression_opts=9,
         )
@@ -204,12 +218,13 @@ class H5Writer:
                     break
 
             # Check if already in the project
-            if cls.uuid_str(uid) in base_handle.keys():
+            uid_str = cls.uuid_str(uid)
+            if uid_str in base_handle.keys():
 
                 if return_parent:
                     return base_handle
 
-                return base_handle[cls.uuid_str(uid)]
+                return base_handle[uid_str]
 
         return None
 
@@ -324,7 +339,6 @@ class H5Writer:
         """
         with fetch_h5_handle(file) as h5file:
             entity_handle = H5Writer.fetch_handle(h5file, entity)
-            str_type = h5py.special_dtype(vlen=str)
 
             for key, attr in entity.attribute_map.items():
 
@@ -345,9 +359,9 @@ class H5Writer:
                 if isinstance(value, (np.int8, bool)):
                     entity_handle.attrs.create(key, int(value), dtype="int8")
                 elif isinstance(value, str):
-                    entity_handle.attrs.create(key, value, dtype=str_type)
+                    entity_handle.attrs.create(key, value, dtype=cls.str_type)
                 elif value is None:
-                    entity_handle.attrs.create(key, "None", dtype=str_type)
+                    entity_handle.attrs.create(key, "None", dtype=cls.str_type)
                 else:
                     entity_handle.attrs.create(
                         key, value, dtype=np.asarray(value).dtype
@@ -443,13 +457,16 @@ class H5Writer:
         with fetch_h5_handle(file) as h5file:
             reference_value_map = getattr(entity_type, "value_map", None)
             names = ["Key", "Value"]
-            formats = ["<u4", h5py.special_dtype(vlen=str)]
+            formats = ["<u4", cls.str_type]
 
             if reference_value_map is not None and reference_value_map.map is not None:
                 entity_type_handle = H5Writer.fetch_handle(h5file, entity_type)
 
-                dtype = list(zip(names, formats))
-                array = np.array(list(reference_value_map.map.items()), dtype=dtype)
+                # Fill the records field by field rather than from (key, value) tuples
+                value_map = reference_value_map.map
+                array = np.empty(len(value_map), dtype=list(zip(names, formats)))
+                array["Key"] = list(value_map.keys())
+                array["Value"] = list(value_map.values())
                 cls.create_dataset(entity_type_handle, array, "Value map")
 
     @classmethod
@@ -466,9 +483,7 @@ class H5Writer:
         """
         with fetch_h5_handle(file) as h5file:
             entity_handle = H5Writer.fetch_handle(h5file, entity)
-            dtype = np.dtype(
-                [("ViewID", h5py.special_dtype(vlen=str)), ("Visible", "int8")]
-            )
+            dtype = np.dtype([("ViewID", cls.str_type), ("Visible", "int8")])
 
             if entity.visible:
                 visible = entity_handle.create_dataset(
@@ -494,11 +509,10 @@ class H5Writer:
             entity_handle = H5Writer.fetch_handle(h5file, entity)
 
             if getattr(entity, attribute, None) is not None:
-                entity_handle.create_dataset(
+                cls.create_dataset(
+                    entity_handle,
+                    np.asarray(getattr(entity, "_" + attribute)),
                     cls.key_map[attribute],
-                    data=getattr(entity, "_" + attribute),
-                    compression="gzip",
-                    compression_opts=9,
                 )
 
             elif attribute in entity_handle.keys():
@@ -536,14 +550,14 @@ class H5Writer:
                 entity_handle.create_dataset(
                     cls.key_map[attribute],
                     data=json.dumps(values, indent=4),
-                    dtype=h5py.special_dtype(vlen=str),
+                    dtype=cls.str_type,
                     shape=(1,),
                 )
             elif isinstance(values, str):
                 entity_handle.create_dataset(
                     cls.key_map[attribute],
                     data=values,
-                    dtype=h5py.special_dtype(vlen=str),
+                    dtype=cls.str_type,
                     shape=(1,),
                 )
             else:
@@ -553,12 +567,7 @@ class H5Writer:
                 else:
                     out_values[np.isnan(out_values)] = entity.ndv()
 
-                entity_handle.create_dataset(
-                    cls.key_map[attribute],
-                    data=out_values,
-                    compression="gzip",
-                    compression_opts=9,
-                )
+                cls.create_dataset(entity_handle, out_values, cls.key_map[attribute])
                 entity_type_handle = H5Writer.fetch_handle(h5file, entity.entity_type)
                 stats_cache = entity_type_handle.get("StatsCache")
                 if stats_cache is not None:
@@ -580,7 +589,6 @@ class H5Writer:
         :return entity: Pointer to the written entity. Active link if "close_file" is False.
         """
         with fetch_h5_handle(file) as h5file:
-            cls.str_type = h5py.special_dtype(vlen=str)
             base = list(h5file.keys())[0]
 
             if isinstance(entity, Data):
@@ -596,9 +604,11 @@ class H5Writer:
                 h5file[base].create_group(entity_type)
 
             # Check if already in the project
-            if cls.uuid_str(uid) in h5file[base][entity_type].keys():
+            uid_str = cls.uuid_str(uid)
+            group_handle = h5file[base][entity_type]
+            if uid_str in group_handle.keys():
 
-                if any([entity.modified_attributes]):
+                if entity.modified_attributes:
 
                     if "entity_type" in entity.modified_attributes:
                         entity_handle = cls.fetch_handle(h5file, entity)
@@ -613,9 +623,9 @@ class H5Writer:
 
                 entity.existing_h5_entity = True
 
-                return h5file[base][entity_type][cls.uuid_str(uid)]
+                return group_handle[uid_str]
 
-            entity_handle = h5file[base][entity_type].create_group(cls.uuid_str(uid))
+            entity_handle = group_handle.create_group(uid_str)
 
             if entity_type == "Groups":
                 entity_handle.create_group("Data")
@@ -670,19 +680,19 @@ class H5Writer:
             if entity_type_str not in h5file[base]["Types"].keys():
                 h5file[base]["Types"].create_group(entity_type_str)
 
-            if cls.uuid_str(uid) in h5file[base]["Types"][entity_type_str].keys():
+            uid_str = cls.uuid_str(uid)
+            types_handle = h5file[base]["Types"][entity_type_str]
+            if uid_str in types_handle.keys():
 
-                if any([entity_type.modified_attributes]):
+                if entity_type.modified_attributes:
                     cls.update_attributes(h5file, entity_type)
                     entity_type.modified_attributes = []
 
                 entity_type.existing_h5_entity = True
 
-                return h5file[base]["Types"][entity_type_str][cls.uuid_str(uid)]
+                return types_handle[uid_str]
 
-            new_type = h5file[base]["Types"][entity_type_str].create_group(
-                cls.uuid_str(uid)
-            )
+            new_type = types_handle.create_group(uid_str)
             H5Writer.write_attributes(h5file, entity_type)
 
             if hasattr(entity_type, "color_map"):
@@ -691,7 +701,7 @@ class H5Writer:
             if hasattr(entity_type, "value_map"):
                 H5Writer.write_value_map(h5file, entity_type)
 
-            entity_type.modified_attributes = False
+            entity_type.modified_attributes = []
             entity_type.existing_h5_entity = True
 
         return new_type
@@ -803,9 +813,7 @@ class H5Writer:
                         elif key == "ID":
                             value = cls.uuid_str(value)
 
-                        group_handle.attrs.create(
-                            key, value, dtype=h5py.special_dtype(vlen=str)
-                        )
+                        group_handle.attrs.create(key, value, dtype=cls.str_type)
 
     @classmethod
     def write_to_parent(
@@ -845,8 +853,9 @@ class H5Writer:
                 parent_handle.create_group(entity_type)
 
             # Check if child uuid not already in h5
-            if cls.uuid_str(uid) not in parent_handle[entity_type].keys():
-                parent_handle[entity_type][cls.uuid_str(uid)] = entity_handle
+            uid_str = cls.uuid_str(uid)
+            if uid_str not in parent_handle[entity_type].keys():
+                parent_handle[entity_type][uid_str] = entity_handle
 
             if recursively:
                 H5Writer.write_to_parent(h5file, entity.parent, recursively=True)
@@ -65,7 +65,7 @@ class BlockModel(ObjectBase):
                 [x_N, y_N, z_N]
             ]
         """
-        if getattr(self, "_centroids", None) is None:
+        if self._centroids is None:
 
             cell_center_u = np.cumsum(self.u_cells) - self.u_cells / 2.0
             cell_center_v = np.cumsum(self.v_cells) - self.v_cells / 2.0
@@ -84,10 +84,10 @@ class BlockModel(ObjectBase):
 
             xyz = np.c_[np.ravel(u_grid), np.ravel(v_grid), np.ravel(z_grid)]
 
-            self._centroids = np.dot(rot, xyz.T).T
-
-            for ind, axis in enumerate(["x", "y", "z"]):
-                self._centroids[:, ind] += self.origin[axis]
+            self._centroids = (
+                xyz @ rot.T
+                + np.r_[self.origin["x"], self.origin["y"], self.origin["z"]]
+            )
 
         return self._centroids
 
@@ -170,9 +170,7 @@ class BlockModel(ObjectBase):
         :obj:`numpy.array` of :obj:`float`:
         Nodal offsets along the u-axis relative to the origin.
         """
-        if (
-            getattr(self, "_u_cell_delimiters", None) is None
-        ) and self.existing_h5_entity:
+        if (self._u_cell_delimiters is None) and self.existing_h5_entity:
             delimiters = self.workspace.fetch_delimiters(self.uid)
             self._u_cell_delimiters = delimiters[0]
             self._v_cell_delimiters = delimiters[1]
@@ -206,9 +204,7 @@ class BlockModel(ObjectBase):
         :obj:`numpy.array` of :obj:`float`:
         Nodal offsets along the v-axis relative to the origin.
         """
-        if (
-            getattr(self, "_v_cell_delimiters", None) is None
-        ) and self.existing_h5_entity:
+        if (self._v_cell_delimiters is None) and self.existing_h5_entity:
             delimiters = self.workspace.fetch_delimiters(self.uid)
             self._u_cell_delimiters = delimiters[0]
             self._v_cell_delimiters = delimiters[1]
@@ -242,9 +238,7 @@ class BlockModel(ObjectBase):
         :obj:`numpy.array` of :obj:`float`:
         Nodal offsets along the z-axis relative to the origin (positive up).
         """
-        if (
-            getattr(self, "_z_cell_delimiters", None) is None
-        ) and self.existing_h5_entity:
+        if (self._z_cell_delimiters is None) and self.existing_h5_entity:
             delimiters = self.workspace.fetch_delimiters(self.uid)
             self._u_cell_delimiters = delimiters[0]
             self._v_cell_delimiters = delimiters[1]
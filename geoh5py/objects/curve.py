@@ -57,13 +57,12 @@ class Curve(Points):
         Array of indices defining segments connecting vertices. Defined based on
         :obj:`~geoh5py.objects.curve.Curve.parts` if set by the user.
         """
-        if getattr(self, "_cells", None) is None:
+        if self._cells is None:
             if self._parts is not None:
-                cells = []
-                for part_id in self.unique_parts:
-                    ind = np.where(self.parts == part_id)[0]
-                    cells.append(np.c_[ind[:-1], ind[1:]])
-                self._cells = np.vstack(cells)
+                # Connect consecutive vertices of each part, parts in ascending order
+                order = np.argsort(self._parts, kind="stable")
+                same_part = self._parts[order[1:]] == self._parts[order[:-1]]
+                self._cells = np.c_[order[:-1][same_part], order[1:][same_part]]
 
             elif self.existing_h5_entity:
                 self._cells = self.workspace.fetch_cells(self.uid)
@@ -78,11 +77,13 @@ class Curve(Points):
 
     @cells.setter
     def cells(self, indices):
-        assert np.issubdtype(
-            indices.dtype, np.integer
-        ), "Indices array must be of integer type"
+        if indices is None:
+            raise AttributeError("Cells cannot be set to None.")
+
+        indices = np.asarray(indices)
+        assert indices.dtype.kind in "iu", "Indices array must be of integer type"
         self.modified_attributes = "cells"
-        self._cells = indices.astype(np.int32)
+        self._cells = np.ascontiguousarray(indices, dtype=np.int32)
         self._parts = None
 
     @property
@@ -124,17 +125,14 @@ class Curve(Points):
         property. The definition of the :obj:`~geoh5py.objects.curve.Curve.cells`
         property get modified by the setting of parts.
         """
-        if getattr(self, "_parts", None) is None and self.cells is not None:
+        if self._parts is None and self.cells is not None:
 
             cells = self.cells
             parts = np.zeros(self.vertices.shape[0], dtype="int")
-            count = 0
-            for ind in range(1, cells.shape[0]):
-
-                if cells[ind, 0] != cells[ind - 1, 1]:
-                    count += 1
 
-                parts[cells[ind, :]] = count
+            # A new part starts wherever a segment does not continue the previous one
+            breaks = np.r_[0, np.cumsum(cells[1:, 0] != cells[:-1, 1])]
+            parts[cells] = breaks[:, None]
 
             self._parts = parts
 
@@ -142,15 +140,13 @@ class Curve(Points):
 
     @parts.setter
     def parts(self, indices: list | np.ndarray):
-        if self.vertices is not None:
-            if isinstance(indices, list):
-                indices = np.asarray(indices, dtype="int32")
-            else:
-                indices = indices.astype("int32")
+        n_vertices = self.n_vertices
+        if n_vertices is not None:
+            indices = np.asarray(indices, dtype="int32")
 
-            assert indices.shape == (
-                self.vertices.shape[0],
-            ), f"Provided parts must be of shape {self.vertices.shape[0]}"
+            assert (
+                indices.ndim == 1 and indices.shape[0] == n_vertices
+            ), f"Provided parts must be of shape {n_vertices}"
 
             self.modified_attributes = "cells"
             self._parts = indices
@@ -40,7 +40,11 @@ class Drillhole(Points):
     __TYPE_UID = uuid.UUID(
         fields=(0x7CAEBF0E, 0xD16E, 0x11E3, 0xBC, 0x69, 0xE4632694AA37)
     )
+    __SURVEYS_DTYPE = np.dtype(
+        [("Depth", "<f4"), ("Dip", "<f4"), ("Azimuth", "<f4")], align=False
+    )
     _attribute_map = Points._attribute_map.copy()
+    _cache_attributes = Points._cache_attributes + ("_surveys_table",)
     _attribute_map.update(
         {
             "Cost": "cost",
@@ -55,6 +59,7 @@ class Drillhole(Points):
         self._cost: float | None = 0.0
         self._planning: str = "Default"
         self._surveys: np.ndarray | None = None
+        self._surveys_table: np.ndarray | None = None
         self._trace: np.ndarray | None = None
         self._trace_depth: np.ndarray | None = None
         self._locations = None
@@ -75,7 +80,7 @@ class Drillhole(Points):
         :obj:`numpy.ndarray` of :obj:`int`, shape (\*, 2):
         Array of indices defining segments connecting vertices.
         """
-        if getattr(self, "_cells", None) is None:
+        if self._cells is None:
             if self.existing_h5_entity:
                 self._cells = self.workspace.fetch_cells(self.uid)
 
@@ -130,13 +135,14 @@ class Drillhole(Points):
         """
         :obj:`numpy.ndarray`: Store the change in x-coordinates along the well path.
         """
-        if getattr(self, "_deviation_x", None) is None and self.surveys is not None:
-            lengths = self.surveys[1:, 0] - self.surveys[:-1, 0]
-            dl_in = np.cos(np.deg2rad(450.0 - self.surveys[:-1, 2] % 360.0)) * np.cos(
-                np.deg2rad(self.surveys[:-1, 1])
+        if self._deviation_x is None and self.surveys is not None:
+            surveys = self.surveys
+            lengths = surveys[1:, 0] - surveys[:-1, 0]
+            dl_in = np.cos(np.deg2rad(450.0 - surveys[:-1, 2] % 360.0)) * np.cos(
+                np.deg2rad(surveys[:-1, 1])
             )
-            dl_out = np.cos(np.deg2rad(450.0 - self.surveys[1:, 2] % 360.0)) * np.cos(
-                np.deg2rad(self.surveys[1:, 1])
+            dl_out = np.cos(np.deg2rad(450.0 - surveys[1:, 2] % 360.0)) * np.cos(
+                np.deg2rad(surveys[1:, 1])
             )
             ddl = np.divide(dl_out - dl_in, lengths, where=lengths != 0)
             self._deviation_x = dl_in + lengths * ddl / 2.0
@@ -148,13 +154,14 @@ class Drillhole(Points):
         """
         :obj:`numpy.ndarray`: Store the change in y-coordinates along the well path.
         """
-        if getattr(self, "_deviation_y", None) is None and self.surveys is not None:
-            lengths = self.surveys[1:, 0] - self.surveys[:-1, 0]
-            dl_in = np.sin(np.deg2rad(450.0 - self.surveys[:-1, 2] % 360.0)) * np.cos(
-                np.deg2rad(self.surveys[:-1, 1])
+        if self._deviation_y is None and self.surveys is not None:
+            surveys = self.surveys
+            lengths = surveys[1:, 0] - surveys[:-1, 0]
+            dl_in = np.sin(np.deg2rad(450.0 - surveys[:-1, 2] % 360.0)) * np.cos(
+                np.deg2rad(surveys[:-1, 1])
             )
-            dl_out = np.sin(np.deg2rad(450.0 - self.surveys[1:, 2] % 360.0)) * np.cos(
-                np.deg2rad(self.surveys[1:, 1])
+            dl_out = np.sin(np.deg2rad(450.0 - surveys[1:, 2] % 360.0)) * np.cos(
+                np.deg2rad(surveys[1:, 1])
             )
             ddl = np.divide(dl_out - dl_in, lengths, where=lengths != 0)
             self._deviation_y = dl_in + lengths * ddl / 2.0
@@ -166,10 +173,11 @@ class Drillhole(Points):
         """
         :obj:`numpy.ndarray`: Store the change in z-coordinates along the well path.
         """
-        if getattr(self, "_deviation_z", None) is None and self.surveys is not None:
-            lengths = self.surveys[1:, 0] - self.surveys[:-1, 0]
-            dl_in = np.sin(np.deg2rad(self.surveys[:-1, 1]))
-            dl_out = np.sin(np.deg2rad(self.surveys[1:, 1]))
+        if self._deviation_z is None and self.surveys is not None:
+            surveys = self.surveys
+            lengths = surveys[1:, 0] - surveys[:-1, 0]
+            dl_in = np.sin(np.deg2rad(surveys[:-1, 1]))
+            dl_out = np.sin(np.deg2rad(surveys[1:, 1]))
             ddl = np.divide(dl_out - dl_in, lengths, where=lengths != 0)
             self._deviation_z = dl_in + lengths * ddl / 2.0
 
@@ -181,11 +189,12 @@ class Drillhole(Points):
         :obj:`numpy.ndarray`: Lookup array of the well path x,y,z coordinates.
         """
         if (
-            getattr(self, "_locations", None) is None
+            self._locations is None
             and self.collar is not None
             and self.surveys is not None
         ):
-            lengths = self.surveys[1:, 0] - self.surveys[:-1, 0]
+            surveys = self.surveys
+            lengths = surveys[1:, 0] - surveys[:-1, 0]
             self._locations = np.c_[
                 self.collar["x"] + np.cumsum(np.r_[0.0, lengths * self.deviation_x]),
                 self.collar["y"] + np.cumsum(np.r_[0.0, lengths * self.deviation_y]),
@@ -210,21 +219,25 @@ class Drillhole(Points):
     @property
     def surveys(self):
         """
-        :obj:`numpy.array` of :obj:`float`, shape (3, ): Coordinates of the surveys
+        :obj:`numpy.array` of :obj:`float`, shape (3, ): Read-only coordinates of the surveys
         """
-        if (getattr(self, "_surveys", None) is None) and self.existing_h5_entity:
+        if self._surveys is None and self.existing_h5_entity:
             self._surveys = self.workspace.fetch_coordinates(self.uid, "surveys")
 
-        if getattr(self, "_surveys", None) is not None:
-            surveys = self._surveys.view("<f4").reshape((-1, 3))
+        if self._surveys is not None and self._surveys_table is None:
+            records = self._surveys.view("<f4").reshape((-1, 3))
 
             # Repeat first survey point at surface for de-survey interpolation
-            surveys = np.vstack([surveys[0, :], surveys])
+            surveys = np.empty((records.shape[0] + 1, 3))
+            surveys[1:, :] = records
+            surveys[0, :] = records[0, :]
             surveys[0, 0] = 0.0
+            # Shared cache, changes must go through the setter
+            surveys.flags.writeable = False
 
-            return surveys.astype(float)
+            self._surveys_table = surveys
 
-        return None
+        return self._surveys_table
 
     @surveys.setter
     def surveys(self, value):
@@ -235,13 +248,15 @@ class Drillhole(Points):
                 raise ValueError("'surveys' requires an ndarray of shape (*, 3)")
 
             self.modified_attributes = "surveys"
-            self._surveys = np.asarray(
-                np.core.records.fromarrays(
-                    value.T, names="Depth, Dip, Azimuth", formats="<f4, <f4, <f4"
-                )
+            # A C-contiguous (*, 3) array of <f4 has the memory layout of the records
+            self._surveys = (
+                np.ascontiguousarray(value, dtype="<f4")
+                .view(self.__SURVEYS_DTYPE)
+                .reshape(-1)
             )
             self.modified_attributes = "trace"
             self._trace = None
+        self._surveys_table = None
         self._deviation_x = None
         self._deviation_y = None
         self._deviation_z = None
@@ -277,7 +292,7 @@ class Drillhole(Points):
         """
         :obj:`numpy.array`: Drillhole trace depth from top to bottom
         """
-        if getattr(self, "_trace_depth", None) is None and self.trace is not None:
+        if self._trace_depth is None and self.trace is not None:
             trace = self.trace
             self._trace_depth = trace[0, 2] - trace[:, 2]
 
@@ -335,8 +350,8 @@ class Drillhole(Points):
                 f"Given value to data {name} should of type {dict}. "
                 f"Type {type(attr)} given instead."
             )
-            assert "values" in list(
-                attr.keys()
+            assert (
+                "values" in attr
             ), f"Given attr for data {name} should include 'values'"
 
             attr["name"] = name
@@ -388,9 +403,8 @@ class Drillhole(Points):
 
             data_objects.append(data_object)
 
-        # Check the depths and re-sort data if necessary
+        # Check the depths and re-sort data if necessary, then finalize
         self.sort_depths()
-        self.workspace.finalize()
         if len(data_objects) == 1:
             return data_object
 
@@ -404,8 +418,7 @@ class Drillhole(Points):
             self.surveys is not None and self.collar is not None
         ), "'surveys' and 'collar' attributes required for desurvey operation"
 
-        if isinstance(depths, list):
-            depths = np.asarray(depths)
+        depths = np.asarray(depths)
 
         ind_loc = np.maximum(
             np.searchsorted(self.surveys[:, 0], depths, side="left") - 1,
@@ -427,14 +440,18 @@ class Drillhole(Points):
         """
         Function to add vertices to the drillhole
         """
-        indices = np.arange(xyz.shape[0])
         if self.n_vertices is None:
+            start = 0
             self.vertices = xyz
         else:
-            indices += self.vertices.shape[0]
-            self.vertices = np.vstack([self.vertices, xyz])
+            start = self._vertices.shape[0]
+            # Append records to the stored array, no float stack and re-copy
+            records = np.array(xyz, dtype="<f8", order="C").view(self._vertices.dtype)
+            self._set_vertex_records(
+                np.concatenate([self._vertices, records.reshape(-1)])
+            )
 
-        return indices.astype("uint32")
+        return np.arange(start, start + xyz.shape[0], dtype="uint32")
 
     def validate_log_data(self, depth, input_values, collocation_distance=1e-4):
         """
@@ -448,8 +465,9 @@ class Drillhole(Points):
 
         input_values = np.r_[input_values]
 
-        if self._depth is None:
-            self.workspace.create_entity(
+        depth_data = self._depth
+        if depth_data is None:
+            depth_data = self.workspace.create_entity(
                 Data,
                 entity={
                     "parent": self,
@@ -459,30 +477,35 @@ class Drillhole(Points):
                 entity_type={"primitive_type": "FLOAT"},
             )
 
-        if self._depth.values is None:  # First data appended
+        if depth_data.values is None:  # First data appended
             self.add_vertices(self.desurvey(depth))
-            depth = np.r_[np.ones(self.n_vertices - depth.shape[0]) * np.nan, depth]
+            depth = np.r_[np.full(self.n_vertices - depth.shape[0], np.nan), depth]
             values = np.r_[
-                np.ones(self.n_vertices - input_values.shape[0]) * np.nan, input_values
+                np.full(self.n_vertices - input_values.shape[0], np.nan), input_values
             ]
-            self._depth.values = depth
+            depth_data.values = depth
 
         else:
             depths, indices = merge_arrays(
-                self._depth.values,
+                depth_data.values,
                 depth,
                 return_mapping=True,
                 collocation_distance=collocation_distance,
             )
             values = merge_arrays(
-                np.ones(self.n_vertices) * np.nan,
+                np.full(self.n_vertices, np.nan),
                 input_values,
                 replace="B->A",
                 mapping=indices,
             )
-            self.add_vertices(self.desurvey(np.delete(depth, indices[:, 1])))
-            self._depth.values = depths
-            self.workspace.finalize()
+            keep = np.ones(depth.shape[0], dtype=bool)
+            keep[indices[:, 1]] = False
+
+            # Skip the desurvey if all depths are collocated with existing vertices
+            if keep.any():
+                self.add_vertices(self.desurvey(depth[keep]))
+
+            depth_data.values = depths
 
         return values
 
@@ -491,8 +514,7 @@ class Drillhole(Points):
         Compare new and current depth values, append new vertices if necessary and return
         an augmented values vector that matches the vertices indexing.
         """
-        if isinstance(from_to, list):
-            from_to = np.vtack(from_to)
+        from_to = np.asarray(from_to)
 
         assert from_to.shape[0] == len(input_values), (
             f"Mismatch between input 'from_to' shape{from_to.shape} "
@@ -500,7 +522,8 @@ class Drillhole(Points):
         )
         assert from_to.shape[1] == 2, "The `from-to` values must have shape(*, 2)"
 
-        if (self._from is None) and (self._to is None):
+        from_data, to_data = self._from, self._to
+        if (from_data is None) and (to_data is None):
             uni_depth, inv_map = np.unique(from_to, return_inverse=True)
             self.cells = self.add_vertices(self.desurvey(uni_depth))[inv_map].reshape(
                 (-1, 2)
@@ -527,64 +550,76 @@ class Drillhole(Points):
             )
         else:
             from_ind = match_values(
-                self._from.values,
+                from_data.values,
                 from_to[:, 0],
                 collocation_distance=collocation_distance,
             )
             to_ind = match_values(
-                self._to.values,
+                to_data.values,
                 from_to[:, 1],
                 collocation_distance=collocation_distance,
             )
 
-            # Find matching cells
-            in_match = np.ones((self._from.values.shape[0], 2)) * np.nan
-            in_match[from_ind[:, 0], 0] = from_ind[:, 1]
-            in_match[to_ind[:, 0], 1] = to_ind[:, 1]
-
-            out_match = np.ones_like(from_to) * np.nan
-            out_match[from_ind[:, 1], 0] = from_ind[:, 0]
-            out_match[to_ind[:, 1], 1] = to_ind[:, 0]
-
-            cell_map = np.c_[
-                np.where(in_match[:, 0] == in_match[:, 1])[0],
-                np.where(out_match[:, 0] == out_match[:, 1])[0],
-            ]
+            cell_map, out_matched = self._match_interval_cells(
+                from_ind, to_ind, from_data.values.shape[0], from_to.shape[0]
+            )
 
             # Add vertices
             vert_new = np.ones_like(from_to, dtype="bool")
             vert_new[from_ind[:, 1], 0] = False
             vert_new[to_ind[:, 1], 1] = False
-            ind_new = np.where(vert_new.flatten())[0]
-            uni_new, inv_map = np.unique(
-                from_to.flatten()[ind_new], return_inverse=True
-            )
+            vert_new = vert_new.ravel()
+            uni_new, inv_map = np.unique(from_to.ravel()[vert_new], return_inverse=True)
 
             # Add cells
-            new_cells = np.ones_like(from_to.flatten()) * np.nan
-            new_cells[ind_new] = self.add_vertices(self.desurvey(uni_new))[inv_map]
+            new_cells = np.full(from_to.size, np.nan)
+            new_cells[vert_new] = self.add_vertices(self.desurvey(uni_new))[inv_map]
             new_cells = new_cells.reshape((-1, 2))
             new_cells[from_ind[:, 1], 0] = self.cells[from_ind[:, 0], 0]
             new_cells[to_ind[:, 1], 1] = self.cells[to_ind[:, 0], 1]
-            new_cells = np.delete(new_cells, cell_map[:, 1], 0)
+            new_cells = new_cells[~out_matched]
 
             # Append values
             input_values = merge_arrays(
-                np.ones(self.n_cells) * np.nan,
+                np.full(self.n_cells, np.nan),
                 np.r_[input_values],
                 replace="B->A",
                 mapping=cell_map,
             )
-            self._from.values = merge_arrays(
-                self._from.values, from_to[:, 0], mapping=cell_map
+            from_data.values = merge_arrays(
+                from_data.values, from_to[:, 0], mapping=cell_map
             )
-            self._to.values = merge_arrays(
-                self._to.values, from_to[:, 1], mapping=cell_map
+            to_data.values = merge_arrays(
+                to_data.values, from_to[:, 1], mapping=cell_map
             )
             self.cells = np.r_[self.cells, new_cells.astype("uint32")]
 
         return input_values
 
+    @staticmethod
+    def _match_interval_cells(from_ind, to_ind, n_cells, n_intervals):
+        """
+        Find the existing cells whose 'FROM' and 'TO' both match a new interval.
+
+        :return: Array of [cell, interval] index pairs and a mask of the new
+            intervals already matched to a cell.
+        """
+        in_match = np.full((n_cells, 2), np.nan)
+        in_match[from_ind[:, 0], 0] = from_ind[:, 1]
+        in_match[to_ind[:, 0], 1] = to_ind[:, 1]
+
+        out_match = np.full((n_intervals, 2), np.nan)
+        out_match[from_ind[:, 1], 0] = from_ind[:, 0]
+        out_match[to_ind[:, 1], 1] = to_ind[:, 0]
+
+        out_matched = out_match[:, 0] == out_match[:, 1]
+        cell_map = np.c_[
+            np.where(in_match[:, 0] == in_match[:, 1])[0],
+            np.flatnonzero(out_matched),
+        ]
+
+        return cell_map, out_matched
+
     def sort_depths(self):
         """
         Read the 'DEPTH' data and sort all Data.values if needed
@@ -594,16 +629,19 @@ class Drillhole(Points):
             depths = data_obj.check_vector_length(data_obj.values)
             if not np.all(np.diff(depths) >= 0):
                 sort_ind = np.argsort(depths)
+                self._preload_children_values()
 
                 for child in self.children:
                     if isinstance(child, Data) and child.association.name == "VERTEX":
                         child.values = child.check_vector_length(child.values)[sort_ind]
 
                 if self.vertices is not None:
-                    self.vertices = self.vertices[sort_ind, :]
+                    # Permute the records directly, no float round-trip
+                    self._set_vertex_records(self._vertices[sort_ind])
 
                 if self.cells is not None:
-                    key_map = np.argsort(sort_ind)[self.cells.flatten()]
-                    self.cells = key_map.reshape((-1, 2)).astype("uint32")
+                    key_map = np.empty(sort_ind.shape[0], dtype="uint32")
+                    key_map[sort_ind] = np.arange(sort_ind.shape[0], dtype="uint32")
+                    self.cells = key_map[self.cells]
 
         self.workspace.finalize()
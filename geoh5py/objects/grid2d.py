@@ -75,7 +75,7 @@ class Grid2D(ObjectBase):
         """
         if self.u_count is not None and self.u_cell_size is not None:
             return (
-                np.cumsum(np.ones(self.u_count) * self.u_cell_size)
+                np.cumsum(np.full(self.u_count, self.u_cell_size, dtype=float))
                 - self.u_cell_size / 2.0
             )
         return None
@@ -88,7 +88,7 @@ class Grid2D(ObjectBase):
         """
         if self.v_count is not None and self.v_cell_size is not None:
             return (
-                np.cumsum(np.ones(self.v_count) * self.v_cell_size)
+                np.cumsum(np.full(self.v_count, self.v_cell_size, dtype=float))
                 - self.v_cell_size / 2.0
             )
         return None
@@ -109,7 +109,7 @@ class Grid2D(ObjectBase):
             ]
         """
         if (
-            getattr(self, "_centroids", None) is None
+            self._centroids is None
             and self.cell_center_u is not None
             and self.cell_center_v is not None
             and self.n_cells is not None
@@ -129,12 +129,10 @@ class Grid2D(ObjectBase):
             else:
                 xyz = np.c_[np.ravel(u_grid), np.ravel(v_grid), np.zeros(self.n_cells)]
 
-            centroids = np.asarray(np.dot(rot, xyz.T).T)
-
-            for ind, axis in enumerate(["x", "y", "z"]):
-                centroids[:, ind] += self.origin[axis]
-
-            self._centroids = centroids
+            self._centroids = (
+                xyz @ rot.T
+                + np.r_[self.origin["x"], self.origin["y"], self.origin["z"]]
+            )
 
         return self._centroids
 
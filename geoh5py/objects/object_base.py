@@ -25,11 +25,11 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from ..data import CommentsData, Data
+from ..data import CommentsData, Data, NumericData
 from ..data.data_association_enum import DataAssociationEnum
 from ..data.primitive_type_enum import PrimitiveTypeEnum
 from ..groups import PropertyGroup
-from ..shared import Entity
+from ..shared import Entity, fetch_h5_handle
 from .object_type import ObjectType
 
 if TYPE_CHECKING:
@@ -166,11 +166,14 @@ class ObjectBase(Entity):
         else:
             uids = self.reference_to_uid(data)
 
+        children_uids = {child.uid for child in self.children}
+        properties = set(prop_group.properties)
         for uid in uids:
-            assert uid in [
-                child.uid for child in self.children
-            ], f"Given data with uuid {uid} does not match any known children"
-            if uid not in prop_group.properties:
+            assert (
+                uid in children_uids
+            ), f"Given data with uuid {uid} does not match any known children"
+            if uid not in properties:
+                properties.add(uid)
                 prop_group.properties.append(uid)
                 self.modified_attributes = "property_groups"
 
@@ -207,11 +210,14 @@ class ObjectBase(Entity):
             else:
                 prop_groups = self.property_groups
 
+            removed = set(uids)
             for prop_group in prop_groups:
-                for uid in uids:
-                    if uid in prop_group.properties:
-                        prop_group.properties.remove(uid)
-                        self.modified_attributes = "property_groups"
+                properties = [
+                    uid for uid in prop_group.properties if uid not in removed
+                ]
+                if len(properties) < len(prop_group.properties):
+                    prop_group.properties[:] = properties
+                    self.modified_attributes = "property_groups"
 
     @property
     def cells(self):
@@ -272,15 +278,13 @@ class ObjectBase(Entity):
 
         :return: A new or existing :obj:`~geoh5py.groups.property_group.PropertyGroup`
         """
-        if "name" in kwargs and any(
-            pg.name == kwargs["name"] for pg in self.property_groups
-        ):
-            prop_group = [
-                pg for pg in self.property_groups if pg.name == kwargs["name"]
-            ][0]
-        else:
-            prop_group = PropertyGroup(**kwargs)
-            self.property_groups = [prop_group]
+        if "name" in kwargs:
+            for prop_group in self.property_groups:
+                if prop_group.name == kwargs["name"]:
+                    return prop_group
+
+        prop_group = PropertyGroup(**kwargs)
+        self.property_groups = [prop_group]
 
         return prop_group
 
@@ -341,6 +345,29 @@ class ObjectBase(Entity):
             return self.vertices.shape[0]
         return None
 
+    def _preload_children_values(self):
+        """
+        Fetch the values of all numeric vertex children not yet loaded from the
+        h5file, opening the file only once.
+        """
+        pending = [
+            child
+            for child in self.children
+            if isinstance(child, NumericData)
+            and child.association is DataAssociationEnum.VERTEX
+            and child.existing_h5_entity
+            and child._values is None  # pylint: disable=W0212
+        ]
+
+        if len(pending) < 2:
+            return
+
+        with fetch_h5_handle(self.workspace.h5file) as h5file:
+            for child in pending:
+                child._values = self.workspace.fetch_values(  # pylint: disable=W0212
+                    child.uid, file=h5file
+                )
+
     @property
     def property_groups(self) -> list[PropertyGroup]:
         """
@@ -351,14 +378,19 @@ class ObjectBase(Entity):
     @property_groups.setter
     def property_groups(self, prop_groups: list[PropertyGroup]):
         # Check for existing property_group
+        uids = {pg.uid for pg in self.property_groups}
+        names = {pg.name for pg in self.property_groups}
+        new_groups = []
         for prop_group in prop_groups:
-            if not any(
-                pg.uid == prop_group.uid for pg in self.property_groups
-            ) and not any(pg.name == prop_group.name for pg in self.property_groups):
+            if prop_group.uid not in uids and prop_group.name not in names:
                 prop_group.parent = self
+                uids.add(prop_group.uid)
+                names.add(prop_group.name)
+                new_groups.append(prop_group)
 
-                self.modified_attributes = "property_groups"
-                self._property_groups = self.property_groups + [prop_group]
+        if new_groups:
+            self.modified_attributes = "property_groups"
+            self._property_groups = self.property_groups + new_groups
 
     @property
     def vertices(self):
@@ -374,9 +406,7 @@ class ObjectBase(Entity):
         """
 
         if "association" in attribute_dict.keys():
-            assert attribute_dict["association"] in [
-                enum.name for enum in DataAssociationEnum
-            ], (
+            assert attribute_dict["association"] in DataAssociationEnum.__members__, (
                 "Data 'association' must be one of "
                 + f"{[enum.name for enum in DataAssociationEnum]}. "
                 + f"{attribute_dict['association']} provided."
@@ -403,8 +433,8 @@ class ObjectBase(Entity):
         if entity_type is None:
             primitive_type = attribute_dict.get("type")
             if primitive_type is not None:
-                assert primitive_type.upper() in list(
-                    PrimitiveTypeEnum.__members__.keys()
+                assert (
+                    primitive_type.upper() in PrimitiveTypeEnum.__members__
                 ), f"Data 'type' should be one of {list(PrimitiveTypeEnum.__members__.keys())}"
                 entity_type = {"primitive_type": primitive_type.upper()}
             else:
@@ -78,10 +78,10 @@ class Octree(ObjectBase):
         level_v = np.log2(self.v_count)
         level_w = np.log2(self.w_count)
 
-        min_level = np.min([level_u, level_v, level_w])
+        min_level = min(level_u, level_v, level_w)
 
         # Check that the refine level doesn't exceed the shortest dimension
-        level = np.min([0, min_level])
+        level = min(0, min_level)
 
         # Number of additional break to account for variable dimensions
         add_u = int(level_u - min_level)
@@ -98,7 +98,7 @@ class Octree(ObjectBase):
             i.flatten(),
             j.flatten(),
             k.flatten(),
-            np.ones_like(i.flatten()) * 2 ** (min_level - level),
+            np.full(i.size, 2 ** (min_level - level)),
         ]
 
         self._octree_cells = np.rec.fromarrays(
@@ -122,7 +122,7 @@ class Octree(ObjectBase):
                 [x_N, y_N, z_N]
             ]
         """
-        if getattr(self, "_centroids", None) is None:
+        if self._centroids is None:
             assert self.octree_cells is not None, "octree_cells must be set"
             assert self.u_cell_size is not None, "u_cell_size must be set"
             assert self.v_cell_size is not None, "v_cell_size must be set"
@@ -147,10 +147,10 @@ class Octree(ObjectBase):
 
             xyz = np.c_[u_grid, v_grid, w_grid]
 
-            self._centroids = np.dot(rot, xyz.T).T
-
-            for ind, axis in enumerate(["x", "y", "z"]):
-                self._centroids[:, ind] += self.origin[axis]
+            self._centroids = (
+                xyz @ rot.T
+                + np.r_[self.origin["x"], self.origin["y"], self.origin["z"]]
+            )
 
         return self._centroids
 
@@ -183,7 +183,7 @@ class Octree(ObjectBase):
                 [i_N, j_N, k_N, size_N]
             ]
         """
-        if getattr(self, "_octree_cells", None) is None:
+        if self._octree_cells is None:
             if self.existing_h5_entity:
                 octree_cells = self.workspace.fetch_octree_cells(self.uid)
                 self._octree_cells = octree_cells
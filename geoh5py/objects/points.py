@@ -30,9 +30,14 @@ class Points(ObjectBase):
     """
 
     __TYPE_UID = uuid.UUID("{202C5DB1-A56D-4004-9CAD-BAAFD8899406}")
+    __VERTICES_DTYPE = np.dtype([("x", "<f8"), ("y", "<f8"), ("z", "<f8")], align=False)
+    # Records must share the memory layout of a (*, 3) array of <f8 for views
+    assert __VERTICES_DTYPE.itemsize == 24
+    _cache_attributes = ObjectBase._cache_attributes + ("_vertices_float_view",)
 
     def __init__(self, object_type: ObjectType, **kwargs):
         self._vertices: np.ndarray | None = None
+        self._vertices_float_view: np.ndarray | None = None
 
         super().__init__(object_type, **kwargs)
 
@@ -50,20 +55,35 @@ class Points(ObjectBase):
         if self._vertices is None and self.existing_h5_entity:
             self._vertices = self.workspace.fetch_coordinates(self.uid, "vertices")
 
-        if self._vertices is not None:
-            return self._vertices.view("<f8").reshape((-1, 3))
+        if self._vertices is not None and self._vertices_float_view is None:
+            self._vertices_float_view = self._vertices.view("<f8").reshape((-1, 3))
 
-        return None
+        return self._vertices_float_view
 
     @vertices.setter
-    def vertices(self, xyz: np.ndarray):
+    def vertices(self, xyz: np.ndarray | list | tuple):
+        if xyz is None:
+            raise AttributeError("Vertices cannot be set to None.")
+
         self.modified_attributes = "vertices"
+        # A C-contiguous (*, 3) array of <f8 has the memory layout of the records
+        if isinstance(xyz, (list, tuple)):
+            xyz = np.array(xyz, dtype="<f8", ndmin=2)
+        else:
+            xyz = np.array(xyz, dtype="<f8", order="C")
+
         assert (
-            xyz.shape[1] == 3
+            xyz.ndim == 2 and xyz.shape[1] == 3
         ), f"Array of vertices must be of shape (*, 3). Array of shape {xyz.shape} provided."
-        self._vertices = np.asarray(
-            np.core.records.fromarrays(
-                xyz.T.tolist(),
-                dtype=[("x", "<f8"), ("y", "<f8"), ("z", "<f8")],
-            )
-        )
+        self._vertices = xyz.view(self.__VERTICES_DTYPE).reshape(-1)
+        self._vertices_float_view = xyz
+
+    def _set_vertex_records(self, records: np.ndarray):
+        """
+        Replace the stored vertex records in place of a float (*, 3) array.
+
+        :param records: Structured array of vertex records sharing the stored dtype.
+        """
+        self._vertices = records
+        self._vertices_float_view = None
+        self.modified_attributes = "vertices"
@@ -46,7 +46,7 @@ class Surface(Points):
         Array of vertices index forming triangles
         :return cells: :obj:`numpy.array` of :obj:`int`, shape ("*", 3)
         """
-        if getattr(self, "_cells", None) is None:
+        if self._cells is None:
             if self.existing_h5_entity:
                 self._cells = self.workspace.fetch_cells(self.uid)
 
@@ -61,11 +61,13 @@ class Surface(Points):
             "int32",
             "uint32",
         ], "Indices array must be of type 'uint32'"
+        assert (
+            indices.ndim == 2 and indices.shape[1] == 3
+        ), f"Array of cells must be of shape (*, 3). Array of shape {indices.shape} provided."
 
-        if indices.dtype == "int32":
-            indices.astype("uint32")
         self.modified_attributes = "cells"
-        self._cells = indices
+        # No copy if already contiguous 'uint32'
+        self._cells = np.ascontiguousarray(indices, dtype="uint32")
 
     @classmethod
     def default_type_uid(cls) -> uuid.UUID:
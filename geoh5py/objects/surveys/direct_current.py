@@ -31,10 +31,12 @@ class PotentialElectrode(Curve):
     """
 
     __TYPE_UID = uuid.UUID("{275ecee9-9c24-4378-bf94-65f3c5fbe163}")
+    _cache_attributes = Curve._cache_attributes + ("_current_electrodes",)
 
     def __init__(self, object_type: ObjectType, **kwargs):
         self._metadata: dict | None = None
         self._ab_cell_id: ReferencedData | None = None
+        self._current_electrodes: CurrentElectrode | None = None
 
         super().__init__(object_type, **kwargs)
 
@@ -43,15 +45,12 @@ class PotentialElectrode(Curve):
         """
         Reference data entity mapping cells to a unique current dipole.
         """
-        if getattr(self, "_ab_cell_id", None) is None:
+        if self._ab_cell_id is None:
             child = self.get_data("A-B Cell ID")
-            if any(child) and isinstance(child[0], ReferencedData):
+            if child and isinstance(child[0], ReferencedData):
                 self.ab_cell_id = child[0]
 
-        if getattr(self, "_ab_cell_id", None) is not None:
-            return self._ab_cell_id
-
-        return None
+        return self._ab_cell_id
 
     @ab_cell_id.setter
     def ab_cell_id(self, data: Data | np.ndarray):
@@ -63,10 +62,10 @@ class PotentialElectrode(Curve):
             if data.dtype != np.int32:
                 print("ab_cell_id values will be converted to type 'int32'")
 
-            if any(self.get_data("A-B Cell ID")):
-                child = self.get_data("A-B Cell ID")[0]
-                if isinstance(child, ReferencedData):
-                    child.values = data.astype(np.int32)
+            children = self.get_data("A-B Cell ID")
+            if children:
+                if isinstance(children[0], ReferencedData):
+                    children[0].values = data.astype(np.int32)
             else:
                 if (
                     getattr(self, "current_electrodes", None) is not None
@@ -112,10 +111,18 @@ class PotentialElectrode(Curve):
             parent = self.parent
 
         omit_list = ["_metadata", "_potential_electrodes", "_current_electrodes"]
+        # Shared between calls so that no entity gets copied twice
+        copied: dict = {}
         new_entity = parent.workspace.copy_to_parent(
-            self, parent, copy_children=copy_children, omit_list=omit_list
+            self,
+            parent,
+            copy_children=copy_children,
+            omit_list=omit_list,
+            copied=copied,
+        )
+        setattr(
+            new_entity, "_ab_cell_id", copied.get(getattr(self.ab_cell_id, "uid", None))
         )
-        setattr(new_entity, "_ab_cell_id", None)
         if new_entity.ab_cell_id is None and self.ab_cell_id is not None:
             self.ab_cell_id.copy(parent=new_entity)
         new_currents = parent.workspace.copy_to_parent(
@@ -123,8 +130,13 @@ class PotentialElectrode(Curve):
             parent,
             copy_children=copy_children,
             omit_list=omit_list,
+            copied=copied,
+        )
+        setattr(
+            new_currents,
+            "_ab_cell_id",
+            copied.get(getattr(self.current_electrodes.ab_cell_id, "uid", None)),
         )
-        setattr(new_currents, "_ab_cell_id", None)
         if (
             new_currents.ab_cell_id is None
             and self.current_electrodes.ab_cell_id is not None
@@ -144,12 +156,21 @@ class PotentialElectrode(Curve):
             raise AttributeError("No Current-Receiver metadata set.")
         currents = self.metadata["Current Electrodes"]
 
+        # Only resolve again if the metadata points to another entity
+        if (
+            self._current_electrodes is not None
+            and self._current_electrodes.uid == currents
+        ):
+            return self._current_electrodes
+
         try:
-            return self.workspace.get_entity(currents)[0]
+            self._current_electrodes = self.workspace.get_entity(currents)[0]
         except IndexError:
             print("Associated CurrentElectrode entity not found in Workspace.")
             return None
 
+        return self._current_electrodes
+
     @current_electrodes.setter
     def current_electrodes(self, current_electrodes: CurrentElectrode):
         if not isinstance(current_electrodes, CurrentElectrode):
@@ -184,9 +205,15 @@ class PotentialElectrode(Curve):
         """
         Metadata attached to the entity.
         """
-        if getattr(self, "_metadata", None) is None:
+        if self._metadata is None and self.existing_h5_entity:
             metadata = self.workspace.fetch_metadata(self.uid)
+            if metadata is None:
+                return None
+
             for key, value in metadata.items():
+                # Only parse strings shaped like a uuid, e.g. "{8-4-4-4-12}"
+                if not isinstance(value, str) or value.count("-") != 4:
+                    continue
                 try:
                     metadata[key] = uuid.UUID(value)
                 except ValueError:
@@ -197,6 +224,10 @@ class PotentialElectrode(Curve):
 
     @metadata.setter
     def metadata(self, values: dict[str, uuid.UUID]):
+        # Nothing to validate or write if re-linking the same entities
+        if values == self._metadata:
+            return
+
         if not len(values) == 2:
             raise ValueError(
                 f"Metadata must have two key-value pairs. {values} provided."
@@ -230,10 +261,14 @@ class CurrentElectrode(PotentialElectrode):
     """
 
     __TYPE_UID = uuid.UUID("{9b08bb5a-300c-48fe-9007-d206f971ea92}")
+    _cache_attributes = PotentialElectrode._cache_attributes + (
+        "_potential_electrodes",
+    )
 
     def __init__(self, object_type: ObjectType, **kwargs):
         self._current_line_id: uuid.UUID | None
         self._metadata: dict[uuid.UUID, uuid.UUID] | None
+        self._potential_electrodes: PotentialElectrode | None = None
 
         super().__init__(object_type, **kwargs)
 
@@ -258,25 +293,36 @@ class CurrentElectrode(PotentialElectrode):
             parent = self.parent
 
         omit_list = ["_metadata", "_potential_electrodes", "_current_electrodes"]
+        # Shared between calls so that no entity gets copied twice
+        copied: dict = {}
         new_entity = parent.workspace.copy_to_parent(
-            self, parent, copy_children=copy_children, omit_list=omit_list
+            self,
+            parent,
+            copy_children=copy_children,
+            omit_list=omit_list,
+            copied=copied,
+        )
+        setattr(
+            new_entity, "_ab_cell_id", copied.get(getattr(self.ab_cell_id, "uid", None))
         )
-        setattr(new_entity, "_ab_cell_id", None)
         if new_entity.ab_cell_id is None and self.ab_cell_id is not None:
             self.ab_cell_id.copy(parent=new_entity)
+        potentials = self.potential_electrodes
         new_potentials = parent.workspace.copy_to_parent(
-            self.potential_electrodes,
+            potentials,
             parent,
             copy_children=copy_children,
             omit_list=omit_list,
+            copied=copied,
         )
-        setattr(new_potentials, "_ab_cell_id", None)
-        if (
-            new_potentials.ab_cell_id is None
-            and self.potential_electrodes is not None
-            and self.potential_electrodes.ab_cell_id is not None
-        ):
-            self.potential_electrodes.ab_cell_id.copy(parent=new_potentials)
+        if potentials is not None:
+            setattr(
+                new_potentials,
+                "_ab_cell_id",
+                copied.get(getattr(potentials.ab_cell_id, "uid", None)),
+            )
+            if new_potentials.ab_cell_id is None and potentials.ab_cell_id is not None:
+                potentials.ab_cell_id.copy(parent=new_potentials)
         new_entity.potential_electrodes = new_potentials
         parent.workspace.finalize()
 
@@ -303,12 +349,21 @@ class CurrentElectrode(PotentialElectrode):
 
         potential = self.metadata["Potential Electrodes"]
 
+        # Only resolve again if the metadata points to another entity
+        if (
+            self._potential_electrodes is not None
+            and self._potential_electrodes.uid == potential
+        ):
+            return self._potential_electrodes
+
         try:
-            return self.workspace.get_entity(potential)[0]
+            self._potential_electrodes = self.workspace.get_entity(potential)[0]
         except IndexError:
             print("Associated PotentialElectrode entity not found in Workspace.")
             return None
 
+        return self._potential_electrodes
+
     @potential_electrodes.setter
     def potential_electrodes(self, potential_electrodes: PotentialElectrode):
         if not isinstance(potential_electrodes, PotentialElectrode):
@@ -334,7 +389,7 @@ class CurrentElectrode(PotentialElectrode):
         """
         Utility function to set ab_cell_id's based on curve cells.
         """
-        if getattr(self, "cells", None) is None:
+        if self.cells is None:
             raise AttributeError(
                 "Cells must be set before assigning default ab_cell_id"
             )
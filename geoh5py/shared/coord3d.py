@@ -15,6 +15,8 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
 
+from __future__ import annotations
+
 import numpy as np
 
 
@@ -26,7 +28,10 @@ class Coord3D:
 
     """
 
-    def __init__(self, xyz: np.ndarray = np.empty((1, 3))):
+    def __init__(self, xyz: np.ndarray | None = None):
+        if xyz is None:
+            xyz = np.empty((1, 3))
+
         self._xyz = xyz
 
     @property
@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from .. import shared
@@ -41,6 +41,8 @@ class Entity(ABC):
         "Public": "public",
         "Visible": "visible",
     }
+    # Private caches rebuilt from other attributes, skipped on copy and compare
+    _cache_attributes: tuple[str, ...] = ()
     _visible = True
 
     def __init__(self, **kwargs):
@@ -55,7 +57,7 @@ class Entity(ABC):
         self._public = True
         self._existing_h5_entity = False
         self._metadata = None
-        self._modified_attributes: list[str] = []
+        self._modified_attributes: dict[str, None] = {}
 
         for attr, item in kwargs.items():
             try:
@@ -199,7 +201,7 @@ class Entity(ABC):
         """
         Metadata attached to the entity.
         """
-        if getattr(self, "_metadata", None) is None:
+        if self._metadata is None and self.existing_h5_entity:
             self._metadata = self.workspace.fetch_metadata(self.uid)
 
         return self._metadata
@@ -219,21 +221,21 @@ class Entity(ABC):
         :obj:`list[str]` List of attributes to be updated in associated workspace
         :obj:`~geoh5py.workspace.workspace.Workspace.h5file`.
         """
-        return self._modified_attributes
+        return list(self._modified_attributes)
 
     @modified_attributes.setter
-    def modified_attributes(self, values: list | str):
+    def modified_attributes(self, values: Iterable[str] | str):
         if self.existing_h5_entity:
-            if not isinstance(values, list):
+            if isinstance(values, str):
                 values = [values]
+            values = list(values)
 
-            # Check if re-setting the list or appending
+            # Check if re-setting the list or appending, in insertion order
             if len(values) == 0:
-                self._modified_attributes = []
+                self._modified_attributes = {}
             else:
                 for value in values:
-                    if value not in self._modified_attributes:
-                        self._modified_attributes.append(value)
+                    self._modified_attributes.setdefault(value, None)
 
     @property
     def name(self) -> str:
@@ -255,13 +257,14 @@ class Entity(ABC):
     def parent(self, parent: shared.Entity | uuid.UUID):
 
         if parent is not None:
-            if isinstance(parent, uuid.UUID):
-                uid = parent
-            else:
-                uid = parent.uid
-
             current_parent = self._parent
-            self._parent = self.workspace.get_entity(uid)[0]
+
+            # Entities of the same workspace need no lookup
+            if isinstance(parent, Entity) and parent.workspace is self.workspace:
+                self._parent = parent
+            else:
+                uid = parent if isinstance(parent, uuid.UUID) else parent.uid
+                self._parent = self.workspace.get_entity(uid)[0]
             self._parent.add_children([self])
 
             if current_parent is not None and current_parent != self._parent:
@@ -20,7 +20,7 @@ from __future__ import annotations
 import uuid
 import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, TypeVar, cast
+from typing import TYPE_CHECKING, Iterable, TypeVar, cast
 
 if TYPE_CHECKING:
     from .. import workspace as ws
@@ -41,7 +41,7 @@ class EntityType(ABC):
         self._name: str | None = "Entity"
         self._description: str | None = None
         self._existing_h5_entity = False
-        self._modified_attributes: list[str] = []
+        self._modified_attributes: dict[str, None] = {}
 
         for attr, item in kwargs.items():
             try:
@@ -107,21 +107,21 @@ class EntityType(ABC):
         :obj:`list[str]` List of attributes to be updated in associated workspace
         :obj:`~geoh5py.workspace.workspace.Workspace.h5file`.
         """
-        return self._modified_attributes
+        return list(self._modified_attributes)
 
     @modified_attributes.setter
-    def modified_attributes(self, values: list | str):
+    def modified_attributes(self, values: Iterable[str] | str):
         if self.existing_h5_entity:
-            if not isinstance(values, list):
+            if isinstance(values, str):
                 values = [values]
+            values = list(values)
 
-            # Check if re-setting the list or appending
+            # Check if re-setting the list or appending, in insertion order
             if len(values) == 0:
-                self._modified_attributes = []
+                self._modified_attributes = {}
             else:
                 for value in values:
-                    if value not in self._modified_attributes:
-                        self._modified_attributes.append(value)
+                    self._modified_attributes.setdefault(value, None)
 
     @staticmethod
     @abstractmethod
@@ -25,14 +25,13 @@ import numpy as np
 
 
 @contextmanager
-def fetch_h5_handle(
-    file: str | h5py.File,
-) -> h5py.File:
+def fetch_h5_handle(file: str | h5py.File, mode: str = "r+") -> h5py.File:
     """
     Open in read+ mode a geoh5 file from string.
     If receiving a file instead of a string, merely return the given file.
 
     :param file: Name or handle to a geoh5 file.
+    :param mode: Mode used to open the file from string.
 
     :return h5py.File: Handle to an opened h5py file.
     """
@@ -42,7 +41,9 @@ def fetch_h5_handle(
         finally:
             pass
     else:
-        h5file = h5py.File(file, "r+")
+        h5file = h5py.File(
+            file, mode, rdcc_nbytes=16 * 1024**2, rdcc_nslots=100_003, rdcc_w0=1.0
+        )
         try:
             yield h5file
         finally:
@@ -108,7 +109,9 @@ def merge_arrays(
         else:
             tail[mapping[:, 1]] = head[mapping[:, 0]]
 
-        tail = np.delete(tail, mapping[:, 1])
+        keep = np.ones(tail.shape[0], dtype=bool)
+        keep[mapping[:, 1]] = False
+        tail = tail[keep]
 
     if return_mapping:
         return np.r_[head, tail], mapping
@@ -119,6 +122,7 @@ def merge_arrays(
 def compare_entities(object_a, object_b, ignore: list | None = None, decimal: int = 6):
 
     ignore_list = ["_workspace", "_children"]
+    ignore_list += getattr(object_a, "_cache_attributes", ())
     if ignore is not None:
         for item in ignore:
             ignore_list.append(item)
@@ -126,18 +130,55 @@ def compare_entities(object_a, object_b, ignore: list | None = None, decimal: in
     for attr in object_a.__dict__.keys():
         if attr in ignore_list:
             continue
-        if isinstance(getattr(object_a, attr[1:]), ABC):
-            compare_entities(
-                getattr(object_a, attr[1:]), getattr(object_b, attr[1:]), ignore=ignore
-            )
+        value_a, value_b = getattr(object_a, attr[1:]), getattr(object_b, attr[1:])
+        if isinstance(value_a, ABC):
+            compare_entities(value_a, value_b, ignore=ignore)
         else:
-            if isinstance(getattr(object_a, attr[1:]), np.ndarray):
-                np.testing.assert_array_almost_equal(
-                    getattr(object_a, attr[1:]).tolist(),
-                    getattr(object_b, attr[1:]).tolist(),
-                    decimal=decimal,
-                )
+            if isinstance(value_a, np.ndarray):
+                # Exact matches short-circuit without a tolerance check
+                if isinstance(value_b, np.ndarray) and np.array_equal(value_a, value_b):
+                    continue
+                # Only plain numeric arrays are compared without a list conversion
+                if value_a.dtype.kind in "biufc":
+                    np.testing.assert_array_almost_equal(
+                        value_a, value_b, decimal=decimal
+                    )
+                else:
+                    np.testing.assert_array_almost_equal(
+                        value_a.tolist(), value_b.tolist(), decimal=decimal
+                    )
             else:
                 assert np.all(
-                    getattr(object_a, attr[1:]) == getattr(object_b, attr[1:])
+                    value_a == value_b
                 ), f"Output attribute '{attr[1:]}' for {object_a} do not match input {object_b}"
+
+
+def get_copy_kwargs(entity, omit_list: tuple = ()) -> tuple[dict, dict]:
+    """
+    Collect the attributes of an entity and of its type to be copied.
+
+    :param entity: Entity to be copied.
+    :param omit_list: List of property names to omit on copy.
+
+    :return: Keyword arguments for the new entity and for its entity type.
+    """
+    omitted = {"_uid", "_entity_type", *omit_list}
+    omitted.update(getattr(entity, "_cache_attributes", ()))
+    entity_kwargs: dict = {"entity": {"uid": None, "parent": None}}
+    for key in entity.__dict__:
+        if key not in omitted:
+            if key[0] == "_":
+                key = key[1:]
+
+            entity_kwargs["entity"][key] = getattr(entity, key)
+
+    omitted_type = {"_workspace", *omit_list}
+    entity_type_kwargs: dict = {"entity_type": {}}
+    for key in entity.entity_type.__dict__:
+        if key not in omitted_type:
+            if key[0] == "_":
+                key = key[1:]
+
+            entity_type_kwargs["entity_type"][key] = getattr(entity.entity_type, key)
+
+    return entity_kwargs, entity_type_kwargs
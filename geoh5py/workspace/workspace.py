@@ -37,6 +37,7 @@ from ..io import H5Reader, H5Writer
 from ..objects import ObjectBase
 from ..shared import fetch_h5_handle, weakref_utils
 from ..shared.entity import Entity
+from ..shared.utils import get_copy_kwargs
 
 if TYPE_CHECKING:
     from ..groups import group
@@ -52,6 +53,8 @@ class Workspace:
 
     :param h5file: File name of the target *geoh5* file.
         A new project is created if the target file cannot by found on disk.
+        An opened :obj:`h5py.File` can also be given, for example an in-memory
+        file created with ``driver="core", backing_store=False``.
     """
 
     _active_ref: ClassVar[ReferenceType[Workspace]] = type(None)  # type: ignore
@@ -63,7 +66,7 @@ class Workspace:
         "Version": "version",
     }
 
-    def __init__(self, h5file: str = "Analyst.geoh5", **kwargs):
+    def __init__(self, h5file: str | h5py.File = "Analyst.geoh5", **kwargs):
 
         self._contributors = np.asarray(
             ["UserName"], dtype=h5py.special_dtype(vlen=str)
@@ -87,7 +90,7 @@ class Workspace:
             except AttributeError:
                 continue
 
-        with h5py.File(self.h5file, "a") as file:
+        with fetch_h5_handle(self.h5file, mode="a") as file:
             try:
                 proj_attributes = self._io_call(file, H5Reader.fetch_project_attributes)
 
@@ -156,7 +159,13 @@ class Workspace:
         self._contributors = np.asarray(value, dtype=h5py.special_dtype(vlen=str))
 
     def copy_to_parent(
-        self, entity, parent, copy_children: bool = True, omit_list: tuple = ()
+        self,
+        entity,
+        parent,
+        copy_children: bool = True,
+        omit_list: tuple = (),
+        *,
+        copied: dict | None = None,
     ):
         """
         Copy an entity to a different parent with copies of children.
@@ -165,27 +174,45 @@ class Workspace:
         :param parent: Target parent to copy the entity under.
         :param copy_children: Copy all children of the entity.
         :param omit_list: List of property names to omit on copy
+        :param copied: Optional dictionary of {uid: copy} shared between calls.
+            Entities already copied are returned as is instead of copied again.
 
         :return: The Entity registered to the workspace.
         """
+        workspace = entity.workspace if parent is None else parent.workspace
+
+        # Write the copied tree through one handle and finalize it once,
+        # rather than re-opening the file on every level of recursion
+        with fetch_h5_handle(workspace.h5file) as h5file:
+            new_object = self._copy_to_parent(
+                entity,
+                parent,
+                {} if copied is None else copied,
+                copy_children=copy_children,
+                omit_list=omit_list,
+                file=h5file,
+            )
+            new_object.workspace.finalize(file=h5file)
 
-        entity_kwargs: dict = {"entity": {"uid": None, "parent": None}}
-        for key in entity.__dict__.keys():
-            if key not in ["_uid", "_entity_type"] + list(omit_list):
-                if key[0] == "_":
-                    key = key[1:]
-
-                entity_kwargs["entity"][key] = getattr(entity, key)
+        return new_object
 
-        entity_type_kwargs: dict = {"entity_type": {}}
-        for key in entity.entity_type.__dict__.keys():
-            if key not in ["_workspace"] + list(omit_list):
-                if key[0] == "_":
-                    key = key[1:]
+    def _copy_to_parent(
+        self,
+        entity,
+        parent,
+        copied: dict,
+        *,
+        copy_children: bool = True,
+        omit_list: tuple = (),
+        file: str | h5py.File | None = None,
+    ):
+        """
+        Copy an entity and its children without finalizing the target workspace.
+        """
+        if entity.uid in copied:
+            return copied[entity.uid]
 
-                entity_type_kwargs["entity_type"][key] = getattr(
-                    entity.entity_type, key
-                )
+        entity_kwargs, entity_type_kwargs = get_copy_kwargs(entity, omit_list)
 
         if parent is None:
             parent = entity.parent
@@ -206,17 +233,20 @@ class Workspace:
             del entity_kwargs["entity"]["property_groups"]
 
         new_object = parent.workspace.create_entity(
-            entity_type, **{**entity_kwargs, **entity_type_kwargs}
+            entity_type, file=file, **{**entity_kwargs, **entity_type_kwargs}
         )
+        copied[entity.uid] = new_object
 
         if copy_children:
             for child in entity.children:
                 new_object.add_children(
-                    [self.copy_to_parent(child, parent=new_object, copy_children=True)]
+                    [
+                        self._copy_to_parent(
+                            child, new_object, copied, copy_children=True, file=file
+                        )
+                    ]
                 )
 
-        new_object.workspace.finalize()
-
         return new_object
 
     @classmethod
@@ -662,19 +692,21 @@ class Workspace:
 
         :param file: :obj:`h5py.File` or name of the target geoh5 file
         """
-        for entity in (
-            cast(List["Entity"], self.objects)
-            + cast(List["Entity"], self.groups)
-            + cast(List["Entity"], self.data)
-        ):
-            if len(entity.modified_attributes) > 0:
-                self.save_entity(entity, file=file)
+        # Open and flush the file once for all the writes below
+        with fetch_h5_handle(self.validate_file(file)) as h5file:
+            for entity in (
+                cast(List["Entity"], self.objects)
+                + cast(List["Entity"], self.groups)
+                + cast(List["Entity"], self.data)
+            ):
+                if len(entity.modified_attributes) > 0:
+                    self.save_entity(entity, file=h5file)
 
-        for entity_type in self.types:
-            if len(entity_type.modified_attributes) > 0:
-                self._io_call(file, H5Writer.write_entity_type, entity_type)
+            for entity_type in self.types:
+                if len(entity_type.modified_attributes) > 0:
+                    H5Writer.write_entity_type(h5file, entity_type)
 
-        self._io_call(file, H5Writer.finalize, self)
+            H5Writer.finalize(h5file, self)
 
     def find_data(self, data_uid: uuid.UUID) -> Entity | None:
         """
@@ -746,15 +778,30 @@ class Workspace:
 
         return entity_list
 
+    def get_entities(self, names: list[str]) -> dict[str, list[Entity | None]]:
+        """
+        Retrieve entities from a list of names, in a single pass over the workspace.
+
+        :param names: List of entity names.
+
+        :return: Dictionary of names and lists of entities with the same name.
+        """
+        entities: dict[str, list[Entity | None]] = {name: [] for name in names}
+        for uid, name in self.list_entities_name.items():
+            if name in entities:
+                entities[name].append(self.find_entity(uid))
+
+        return entities
+
     @property
     def groups(self) -> list[groups.Group]:
         """Get all active Group entities registered in the workspace."""
         return self._all_groups()
 
     @property
-    def h5file(self) -> str:
+    def h5file(self) -> str | h5py.File:
         """
-        :str: Target *geoh5* file name with path.
+        :str: Target *geoh5* file name with path, or handle to an opened file.
         """
         return self._h5file
 
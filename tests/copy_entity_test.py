@@ -21,30 +21,30 @@ from pathlib import Path
 import numpy as np
 from scipy import spatial
 
-from geoh5py.objects import Curve, Octree, Points, Surface
+from geoh5py.objects import Curve, Drillhole, Octree, Points, Surface
 from geoh5py.shared.utils import compare_entities
 from geoh5py.workspace import Workspace
 
 
 def test_copy_entity():
-
+    rng = np.random.default_rng(0)
     # Generate a random cloud of points
     n_data = 12
-    xyz = np.random.randn(n_data, 3)
+    xyz = rng.standard_normal((n_data, 3))
 
     # Create surface
     surf_2d = spatial.Delaunay(xyz[:, :2])
 
     objects = {
-        Points: {"name": "Something", "vertices": np.random.randn(n_data, 3)},
+        Points: {"name": "Something", "vertices": rng.standard_normal((n_data, 3))},
         Surface: {
             "name": "Surface",
-            "vertices": np.random.randn(n_data, 3),
+            "vertices": rng.standard_normal((n_data, 3)),
             "cells": getattr(surf_2d, "simplices"),
         },
         Curve: {
             "name": "Curve",
-            "vertices": np.random.randn(n_data, 3),
+            "vertices": rng.standard_normal((n_data, 3)),
         },
         Octree: {
             "origin": [0, 0, 0],
@@ -67,9 +67,9 @@ def test_copy_entity():
             entity = obj.create(workspace, **kwargs)
 
             if getattr(entity, "vertices", None) is not None:
-                values = np.random.randn(entity.n_vertices)
+                values = rng.standard_normal(entity.n_vertices)
             else:
-                values = np.random.randn(entity.n_cells)
+                values = rng.standard_normal(entity.n_cells)
 
             entity.add_data({"DataValues": {"values": values}})
 
@@ -87,3 +87,39 @@ def test_copy_entity():
 
             compare_entities(entity, rec_entity, ignore=["_parent"])
             compare_entities(entity.children[0], rec_data, ignore=["_parent"])
+
+
+def test_copy_empty_points_and_drillhole():
+    with tempfile.TemporaryDirectory() as tempdir:
+        h5file_path = Path(tempdir) / r"testEmpty.geoh5"
+        workspace = Workspace(h5file_path)
+        points = Points.create(workspace)
+        well = Drillhole.create(
+            workspace,
+            collar=np.r_[0.0, 10.0, 10.0],
+            surveys=np.c_[[0.0, 100.0], [45.0, 45.0], [-80.0, -80.0]],
+        )
+
+        for entity in [points, well]:
+            copy = entity.copy()
+            assert copy.vertices is None, "Copy of an empty object gained vertices"
+
+        workspace.finalize()
+
+        # Same from an object read back from file
+        workspace = Workspace(h5file_path)
+        rec_well = workspace.get_entity(well.uid)[0]
+        rec_copy = rec_well.copy()
+        assert rec_copy.vertices is None, "Copy of an empty object gained vertices"
+        np.testing.assert_array_equal(
+            rec_copy.collar.tolist(), rec_well.collar.tolist()
+        )
+
+
+def test_copy_curve_without_cells():
+    with tempfile.TemporaryDirectory() as tempdir:
+        workspace = Workspace(Path(tempdir) / r"testEmpty.geoh5")
+        curve = Curve.create(workspace)
+        copy = curve.copy()
+
+        assert copy.cells is None, "Copy of an empty curve gained cells"
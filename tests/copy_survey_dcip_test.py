@@ -22,13 +22,14 @@ from pathlib import Path
 
 import numpy as np
 
+from geoh5py.groups import ContainerGroup
 from geoh5py.objects import CurrentElectrode, PotentialElectrode
 from geoh5py.shared.utils import compare_entities
 from geoh5py.workspace import Workspace
 
 
 def test_copy_survey_dcip():
-
+    rng = np.random.default_rng(0)
     name = "TestCurrents"
     n_data = 12
 
@@ -69,7 +70,7 @@ def test_copy_survey_dcip():
 
         potentials.cells = np.vstack(dipoles).astype("uint32")
         potentials.add_data(
-            {"fake_ab": {"values": np.random.randn(potentials.n_cells)}}
+            {"fake_ab": {"values": rng.standard_normal(potentials.n_cells)}}
         )
         potentials.ab_cell_id = np.hstack(current_id).astype("int32")
         currents.potential_electrodes = potentials
@@ -110,3 +111,65 @@ def test_copy_survey_dcip():
         compare_entities(
             potentials, potentials_rec, ignore=["_current_electrodes", "_parent"]
         )
+
+
+def _create_linked_survey(workspace, parent=None):
+    """Create a small pair of linked current and potential electrodes."""
+    vertices = np.c_[np.arange(4.0), np.zeros(4), np.zeros(4)]
+    cells = np.c_[[0, 2], [1, 3]].astype("uint32")
+    currents = CurrentElectrode.create(
+        workspace, vertices=vertices, cells=cells, parent=parent
+    )
+    currents.add_default_ab_cell_id()
+    potentials = PotentialElectrode.create(
+        workspace, vertices=vertices, cells=cells, parent=parent
+    )
+    potentials.ab_cell_id = np.r_[1, 2].astype("int32")
+    potentials.current_electrodes = currents
+
+    return currents, potentials
+
+
+def test_copy_survey_dcip_once():
+    with tempfile.TemporaryDirectory() as tempdir:
+        workspace = Workspace(Path(tempdir) / r"testDC_once.geoh5")
+        currents, potentials = _create_linked_survey(workspace)
+        n_entities = 2 + len(currents.children) + len(potentials.children)
+
+        copy_workspace = Workspace(Path(tempdir) / r"testDC_once_copy.geoh5")
+        n_root = len(copy_workspace.list_entities_name)
+        potentials_copy = potentials.copy(parent=copy_workspace)
+
+        assert len(copy_workspace.list_entities_name) == n_root + n_entities
+        assert len(potentials_copy.get_data("A-B Cell ID")) == 1
+
+        # Entities already in the shared map are returned, not copied again
+        copied: dict = {}
+        first = copy_workspace.copy_to_parent(currents, copy_workspace, copied=copied)
+        n_copied = len(copy_workspace.list_entities_name)
+        second = copy_workspace.copy_to_parent(currents, copy_workspace, copied=copied)
+
+        assert second is first
+        assert len(copy_workspace.list_entities_name) == n_copied
+
+
+def test_copy_group_with_linked_survey():
+    with tempfile.TemporaryDirectory() as tempdir:
+        workspace = Workspace(Path(tempdir) / r"testDC_group.geoh5")
+        group = ContainerGroup.create(workspace)
+        currents, potentials = _create_linked_survey(workspace, parent=group)
+
+        # Populate the cached links before copying the whole group
+        assert potentials.current_electrodes is currents
+        assert currents.potential_electrodes is potentials
+
+        new_group = group.copy()
+
+        assert {type(child) for child in new_group.children} == {
+            CurrentElectrode,
+            PotentialElectrode,
+        }
+        assert all(
+            child.uid not in [currents.uid, potentials.uid]
+            for child in new_group.children
+        )
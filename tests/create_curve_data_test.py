@@ -15,9 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
 
-import tempfile
-from pathlib import Path
-
+import h5py
 import numpy as np
 
 from geoh5py.objects import Curve
@@ -26,21 +24,24 @@ from geoh5py.workspace import Workspace
 
 
 def test_create_curve_data():
-
+    rng = np.random.default_rng(0)
     curve_name = "TestCurve"
 
     # Generate a random cloud of points
     n_data = 12
 
-    with tempfile.TemporaryDirectory() as tempdir:
-
-        h5file_path = Path(tempdir) / r"testCurve.geoh5"
+    # Keep the whole round-trip in memory, without any disk writes
+    with h5py.File(
+        "testCurve.geoh5", "w", driver="core", backing_store=False
+    ) as h5file:
 
         # Create a workspace
-        workspace = Workspace(h5file_path)
+        workspace = Workspace(h5file)
 
         curve = Curve.create(
-            workspace, vertices=np.random.randn(n_data, 3), name=curve_name
+            workspace,
+            vertices=rng.standard_normal((n_data, 3)),
+            name=curve_name,
         )
 
         # Get and change the parts
@@ -50,18 +51,21 @@ def test_create_curve_data():
 
         data_objects = curve.add_data(
             {
-                "vertexValues": {"values": np.random.randn(curve.n_vertices)},
-                "cellValues": {"values": np.random.randn(curve.n_cells)},
+                "vertexValues": {"values": rng.standard_normal(curve.n_vertices)},
+                "cellValues": {"values": rng.standard_normal(curve.n_cells)},
             }
         )
 
         workspace.finalize()
         # Re-open the workspace and read data back in
-        ws2 = Workspace(h5file_path)
+        ws2 = Workspace(h5file)
 
-        obj_rec = ws2.get_entity(curve_name)[0]
-        data_vert_rec = ws2.get_entity("vertexValues")[0]
-        data_cell_rec = ws2.get_entity("cellValues")[0]
+        obj_rec, data_vert_rec, data_cell_rec = (
+            entities[0]
+            for entities in ws2.get_entities(
+                [curve_name, "vertexValues", "cellValues"]
+            ).values()
+        )
 
         # Check entities
         compare_entities(curve, obj_rec)
@@ -69,14 +73,34 @@ def test_create_curve_data():
         compare_entities(data_objects[1], data_cell_rec)
 
         # Modify and write
-        obj_rec.vertices = np.random.randn(n_data, 3)
-        data_vert_rec.values = np.random.randn(n_data)
+        obj_rec.vertices = rng.standard_normal((n_data, 3))
+        data_vert_rec.values = rng.standard_normal(n_data)
         ws2.finalize()
 
         # Read back and compare
-        ws3 = Workspace(h5file_path)
+        ws3 = Workspace(h5file)
         obj = ws3.get_entity(curve_name)[0]
         data_vertex = ws3.get_entity("vertexValues")[0]
 
         compare_entities(obj_rec, obj)
         compare_entities(data_vert_rec, data_vertex)
+
+
+def test_get_entities():
+    rng = np.random.default_rng(0)
+    with h5py.File(
+        "testGetEntities.geoh5", "w", driver="core", backing_store=False
+    ) as h5file:
+        workspace = Workspace(h5file)
+        curve = Curve.create(
+            workspace,
+            vertices=rng.standard_normal((4, 3)),
+            name="shared",
+        )
+        data = curve.add_data({"shared": {"values": rng.standard_normal(4)}})
+
+        entities = workspace.get_entities(["shared", "missing"])
+
+        assert entities["missing"] == [], "Missing name should give an empty list"
+        assert len(entities["shared"]) == 2, "Expected one object and one data"
+        assert curve in entities["shared"] and data in entities["shared"]
@@ -21,6 +21,7 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from geoh5py.objects import Drillhole
 from geoh5py.shared.utils import compare_entities
@@ -28,7 +29,7 @@ from geoh5py.workspace import Workspace
 
 
 def test_create_drillhole_data():
-
+    rng = np.random.default_rng(0)
     well_name = "bullseye"
     n_data = 10
     collocation = 1e-5
@@ -56,16 +57,16 @@ def test_create_drillhole_data():
             )
 
         # Create random from-to
-        from_to_a = np.sort(
-            np.random.uniform(low=0.05, high=max_depth, size=(50,))
-        ).reshape((-1, 2))
+        from_to_a = np.sort(rng.uniform(low=0.05, high=max_depth, size=(50,))).reshape(
+            (-1, 2)
+        )
         from_to_b = np.vstack([from_to_a[0, :], [30.1, 55.5], [56.5, 80.2]])
 
         # Add from-to data
         data_objects = well.add_data(
             {
                 "interval_values": {
-                    "values": np.random.randn(from_to_a.shape[0]),
+                    "values": rng.standard_normal(from_to_a.shape[0]),
                     "from-to": from_to_a,
                 },
                 "int_interval_list": {
@@ -100,9 +101,9 @@ def test_create_drillhole_data():
             well.add_data(
                 {
                     "log_values": {
-                        "depth": np.sort(np.random.rand(n_data) * max_depth),
+                        "depth": np.sort(rng.random(n_data) * max_depth),
                         "type": "referenced",
-                        "values": np.random.randint(1, high=8, size=n_data),
+                        "values": rng.integers(1, high=8, size=n_data),
                         "value_map": value_map,
                     }
                 }
@@ -110,9 +111,8 @@ def test_create_drillhole_data():
         ]
         workspace.finalize()
 
-        new_count = from_to_a.size + 4 + n_data
         assert well.n_vertices == (
-            new_count
+            from_to_a.size + 4 + n_data
         ), "Error with new number of vertices on log data creation."
         # Re-open the workspace and read data back in
         new_workspace = Workspace(h5file_path)
@@ -140,10 +140,11 @@ def test_create_drillhole_data():
 
 
 def test_single_survey():
+    rng = np.random.default_rng(0)
     # Create a simple well
-    dist = np.random.rand(1) * 100.0
-    azm = np.random.randn(1) * 180.0
-    dip = np.random.randn(1) * 180.0
+    dist = rng.random(1) * 100.0
+    azm = rng.standard_normal(1) * 180.0
+    dip = rng.standard_normal(1) * 180.0
 
     collar = np.r_[0.0, 10.0, 10.0]
 
@@ -169,11 +170,30 @@ def test_single_survey():
         np.testing.assert_array_almost_equal(locations, solution, decimal=3)
 
 
+def test_surveys_read_only():
+    with tempfile.TemporaryDirectory() as tempdir:
+        workspace = Workspace(Path(tempdir) / r"testCurve.geoh5")
+        well = Drillhole.create(
+            workspace,
+            collar=np.r_[0.0, 10.0, 10.0],
+            surveys=np.c_[[0.0, 100.0], [-80.0, -80.0], [45.0, 45.0]],
+        )
+        surveys = well.surveys.copy()
+        locations = well.desurvey([50.0])
+
+        with pytest.raises(ValueError):
+            well.surveys[1, 1] = 999.0
+
+        np.testing.assert_array_equal(well.surveys, surveys)
+        np.testing.assert_array_equal(well.desurvey([50.0]), locations)
+
+
 def test_outside_survey():
+    rng = np.random.default_rng(0)
     # Create a simple well
-    dist = np.random.rand(2) * 100.0
-    azm = [np.random.randn(1) * 180.0] * 2
-    dip = [np.random.randn(1) * 180.0] * 2
+    dist = rng.random(2) * 100.0
+    azm = [rng.standard_normal(1) * 180.0] * 2
+    dip = [rng.standard_normal(1) * 180.0] * 2
 
     collar = np.r_[0.0, 10.0, 10.0]
 
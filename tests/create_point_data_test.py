@@ -27,18 +27,16 @@ from geoh5py.shared.utils import compare_entities
 from geoh5py.workspace import Workspace
 
 
-def test_create_point_data():
-
+def test_create_point_data(random_points):
+    # Seeded apart from random_points, so the values are independent of it
+    rng = np.random.default_rng(1)
     new_name = "TestName"
-
-    # Generate a random cloud of points
-    xyz = np.random.randn(12, 3)
-    values = np.random.randn(12)
+    values = rng.standard_normal(12)
 
     with tempfile.TemporaryDirectory() as tempdir:
         h5file_path = Path(tempdir) / r"testPoints.geoh5"
         workspace = Workspace(h5file_path)
-        points = Points.create(workspace, vertices=xyz, allow_move=False)
+        points = Points.create(workspace, vertices=random_points, allow_move=False)
         data = points.add_data(
             {"DataValues": {"association": "VERTEX", "values": values}}
         )
@@ -59,10 +57,9 @@ def test_create_point_data():
         workspace.finalize()
         # Read the data back in from a fresh workspace
         new_workspace = Workspace(h5file_path)
-        rec_obj = new_workspace.get_entity("Points")[0]
         rec_data = new_workspace.get_entity(new_name)[0]
         rec_tag = new_workspace.get_entity("my_comment")[0]
-        compare_entities(points, rec_obj)
+        compare_entities(points, new_workspace.get_entity("Points")[0])
         compare_entities(data, rec_data)
         compare_entities(tag, rec_tag)
         with fetch_h5_handle(h5file_path) as h5file:
@@ -70,3 +67,12 @@ def test_create_point_data():
             assert (
                 etype_handle.get("StatsCache") is None
             ), "StatsCache was not properly deleted on update of values"
+
+
+def test_create_points_from_tuple():
+    with tempfile.TemporaryDirectory() as tempdir:
+        workspace = Workspace(Path(tempdir) / r"testPoints.geoh5")
+        # Single vertex given as a tuple
+        point = Points.create(workspace, vertices=(1.0, 2.0, 3.0))
+
+        np.testing.assert_array_equal(point.vertices, [[1.0, 2.0, 3.0]])
@@ -28,12 +28,12 @@ from geoh5py.workspace import Workspace
 
 
 def test_create_reference_data():
-
+    rng = np.random.default_rng(0)
     name = "MyTestPointset"
 
     # Generate a random cloud of points with reference values
     n_data = 12
-    values = np.random.randint(1, high=8, size=n_data)
+    values = rng.integers(1, high=8, size=n_data)
     refs = np.unique(values)
     value_map = {}
     for ref in refs:
@@ -48,7 +48,10 @@ def test_create_reference_data():
         workspace = Workspace(h5file_path)
 
         points = Points.create(
-            workspace, vertices=np.random.randn(n_data, 3), name=name, allow_move=False
+            workspace,
+            vertices=rng.standard_normal((n_data, 3)),
+            name=name,
+            allow_move=False,
         )
 
         data = points.add_data(
@@ -27,25 +27,21 @@ from geoh5py.workspace import Workspace
 
 
 def test_create_surface_data():
-
+    rng = np.random.default_rng(0)
     with tempfile.TemporaryDirectory() as tempdir:
         h5file_path = Path(tempdir) / r"testSurface.geoh5"
 
         workspace = Workspace(h5file_path)
 
         # Create a grid of points and triangulate
-        x, y = np.meshgrid(np.arange(10), np.arange(10))
-        x, y = x.ravel(), y.ravel()
-        z = np.random.randn(x.shape[0])
-
-        del_surf = spatial.Delaunay(np.c_[x, y])
+        xy = np.indices((10, 10), dtype=np.float64)[::-1].reshape(2, -1).T
+        x, y = xy[:, 0], xy[:, 1]
+        z = rng.standard_normal(x.shape[0])
 
-        simplices = getattr(del_surf, "simplices")
+        simplices = spatial.Delaunay(xy).simplices.astype(np.uint32, copy=False)
 
         # Create random data
-        values = np.mean(
-            np.c_[x[simplices[:, 0]], x[simplices[:, 1]], x[simplices[:, 2]]], axis=1
-        )
+        values = x[simplices].mean(axis=1)
 
         # Create a geoh5 surface
         surface = Surface.create(
@@ -30,7 +30,7 @@ from geoh5py.workspace import Workspace
 
 
 def test_create_survey_dcip():
-
+    rng = np.random.default_rng(0)
     name = "TestCurrents"
     n_data = 12
 
@@ -72,7 +72,7 @@ def test_create_survey_dcip():
         potentials.cells = np.vstack(dipoles).astype("uint32")
 
         fake_ab = potentials.add_data(
-            {"fake_ab": {"values": np.random.randn(potentials.n_cells)}}
+            {"fake_ab": {"values": rng.standard_normal(potentials.n_cells)}}
         )
 
         with pytest.raises(TypeError):
@@ -169,3 +169,24 @@ def test_create_survey_dcip():
         compare_entities(
             potentials, potentials_rec, ignore=["_current_electrodes", "_parent"]
         )
+
+
+def test_survey_dcip_same_metadata():
+    vertices = np.c_[np.arange(4.0), np.zeros(4), np.zeros(4)]
+    cells = np.c_[[0, 2], [1, 3]].astype("uint32")
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir) / r"testDC_metadata.geoh5"
+        workspace = Workspace(path)
+        currents = CurrentElectrode.create(workspace, vertices=vertices, cells=cells)
+        potentials = PotentialElectrode.create(
+            workspace, vertices=vertices, cells=cells
+        )
+        potentials.current_electrodes = currents
+
+        new_workspace = Workspace(path)
+        potentials_rec = new_workspace.get_entity(potentials.uid)[0]
+
+        # Re-assigning the same metadata should not flag a re-write
+        potentials_rec.metadata = dict(potentials_rec.metadata)
+        assert "metadata" not in potentials_rec.modified_attributes
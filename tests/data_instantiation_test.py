@@ -16,8 +16,6 @@
 #  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
 
 import inspect
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -34,47 +32,46 @@ def all_data_types():
 
 
 @pytest.mark.parametrize("data_class", all_data_types())
-def test_data_instantiation(data_class):
+def test_data_instantiation(data_class, tmp_path):
     # TODO: no file on disk should be required for this test
     #       as workspace does not have to be saved
-    with tempfile.TemporaryDirectory() as tempdir:
-        the_workspace = Workspace(Path(tempdir) / f"{__name__}.geoh5")
-
-        data_type = DataType.create(the_workspace, data_class)
-        assert data_type.uid is not None
-        assert data_type.uid.int != 0
-        assert data_type.name == "Entity"
-        assert data_type.units is None
-        assert data_type.primitive_type == data_class.primitive_type()
-        assert the_workspace.find_type(data_type.uid, DataType) is data_type
-        assert DataType.find(the_workspace, data_type.uid) is data_type
-
-        # searching for the wrong type
-        assert the_workspace.find_type(data_type.uid, ObjectType) is None
-
-        created_data = data_class(
-            data_type, association=DataAssociationEnum.VERTEX, name="test"
-        )
-        assert created_data.uid is not None
-        assert created_data.uid.int != 0
-        assert created_data.name == "test"
-        assert created_data.association == DataAssociationEnum.VERTEX
-
-        _can_find(the_workspace, created_data)
-
-        # now, make sure that unused data and types do not remain reference in the workspace
-        data_type_uid = data_type.uid
-        data_type = None  # type: ignore
-        # data_type is still referenced by created_data, so it should survive in the workspace
-        assert the_workspace.find_type(data_type_uid, DataType) is not None
-
-        created_data_uid = created_data.uid
-        created_data = None  # type: ignore
-        # no more reference on created_data, so it should be gone from the workspace
-        assert the_workspace.find_data(created_data_uid) is None
-
-        # no more reference on data_type, so it should be gone from the workspace
-        assert the_workspace.find_type(data_type_uid, DataType) is None
+    the_workspace = Workspace(tmp_path / f"{__name__}.geoh5")
+
+    data_type = DataType.create(the_workspace, data_class)
+    assert data_type.uid is not None
+    assert data_type.uid.int != 0
+    assert data_type.name == "Entity"
+    assert data_type.units is None
+    assert data_type.primitive_type == data_class.primitive_type()
+    assert the_workspace.find_type(data_type.uid, DataType) is data_type
+    assert DataType.find(the_workspace, data_type.uid) is data_type
+
+    # searching for the wrong type
+    assert the_workspace.find_type(data_type.uid, ObjectType) is None
+
+    created_data = data_class(
+        data_type, association=DataAssociationEnum.VERTEX, name="test"
+    )
+    assert created_data.uid is not None
+    assert created_data.uid.int != 0
+    assert created_data.name == "test"
+    assert created_data.association == DataAssociationEnum.VERTEX
+
+    _can_find(the_workspace, created_data)
+
+    # now, make sure that unused data and types do not remain reference in the workspace
+    data_type_uid = data_type.uid
+    data_type = None  # type: ignore
+    # data_type is still referenced by created_data, so it should survive in the workspace
+    assert the_workspace.find_type(data_type_uid, DataType) is not None
+
+    created_data_uid = created_data.uid
+    created_data = None  # type: ignore
+    # no more reference on created_data, so it should be gone from the workspace
+    assert the_workspace.find_data(created_data_uid) is None
+
+    # no more reference on data_type, so it should be gone from the workspace
+    assert the_workspace.find_type(data_type_uid, DataType) is None
 
 
 def _can_find(workspace, created_data):
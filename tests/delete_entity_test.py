@@ -26,10 +26,10 @@ from geoh5py.objects import Curve
 from geoh5py.workspace import Workspace
 
 
-def test_delete_entities():
-
-    xyz = np.random.randn(12, 3)
-    values = np.random.randn(12)
+def test_delete_entities(random_points):
+    rng = np.random.default_rng(0)
+    xyz = random_points
+    values = rng.standard_normal(12)
 
     with tempfile.TemporaryDirectory() as tempdir:
         # Create a workspace
@@ -44,7 +44,7 @@ def test_delete_entities():
 
         # Add data
         for i in range(4):
-            values = np.random.randn(curve_2.n_vertices)
+            values = rng.standard_normal(curve_2.n_vertices)
             if i == 0:  # Share the data type
                 curve_2.add_data(
                     {
@@ -25,10 +25,9 @@ from geoh5py.workspace import Workspace
 
 
 def test_insert_drillhole_data():
-
+    rng = np.random.default_rng(0)
     well_name = "bullseye"
     n_data = 10
-    collocation = 1e-5
 
     with tempfile.TemporaryDirectory() as tempdir:
         h5file_path = Path(tempdir) / r"testCurve.geoh5"
@@ -44,14 +43,14 @@ def test_insert_drillhole_data():
                 np.ones(n_data) * 45.0,
             ],
             name=well_name,
-            default_collocation_distance=collocation,
+            default_collocation_distance=1e-5,
         )
         # Add log-data
         data_object = well.add_data(
             {
                 "log_values": {
-                    "depth": np.sort(np.random.rand(n_data) * max_depth),
-                    "values": np.random.randint(1, high=8, size=n_data),
+                    "depth": np.sort(rng.random(n_data) * max_depth),
+                    "values": rng.integers(1, high=8, size=n_data),
                 }
             }
         )
@@ -61,7 +60,7 @@ def test_insert_drillhole_data():
         # Add more data with single match
         old_depths = well.get_data("DEPTH")[0].values
         indices = np.where(~np.isnan(old_depths))[0]
-        insert = np.random.randint(0, high=len(indices) - 1, size=2)
+        insert = rng.integers(0, high=len(indices) - 1, size=2)
         new_depths = old_depths[indices[insert]]
         new_depths[0] -= 2e-6  # Out of tolerance
         new_depths[1] -= 5e-7  # Within tolerance
@@ -70,7 +69,7 @@ def test_insert_drillhole_data():
             {
                 "match_depth": {
                     "depth": new_depths,
-                    "values": np.random.randint(1, high=8, size=2),
+                    "values": rng.integers(1, high=8, size=2),
                     "collocation_distance": 1e-6,
                 }
             }
@@ -93,3 +92,42 @@ def test_insert_drillhole_data():
             assert all(
                 ind in [indices[insert][0], indices[insert][1]] for ind in insert_ind
             ), "Depth insertion error"
+
+
+def test_insert_drillhole_data_on_file():
+    depths = np.linspace(0.0, 90.0, 10)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        h5file_path = Path(tempdir) / r"testCurve.geoh5"
+        workspace = Workspace(h5file_path)
+        well = Drillhole.create(
+            workspace,
+            collar=np.r_[0.0, 10.0, 10],
+            surveys=np.c_[[0.0, 100.0], [-89.0, -75.0], [45.0, 45.0]],
+        )
+        # Several vertex data written to file, sharing the same depths
+        well.add_data(
+            {
+                "log_a": {"depth": depths, "values": depths * 10.0},
+                "log_b": {"depth": depths, "values": depths * 20.0},
+            }
+        )
+        workspace.finalize()
+
+        # Insert depths in between from a fresh workspace, to re-sort on-file values
+        workspace = Workspace(h5file_path)
+        well = workspace.get_entity(well.uid)[0]
+        well.add_data(
+            {"log_c": {"depth": depths[:-1] + 5.0, "values": depths[:-1] + 5.0}}
+        )
+
+        workspace = Workspace(h5file_path)
+        well = workspace.get_entity(well.uid)[0]
+        new_depths = well.get_data("DEPTH")[0].values
+        assert np.all(np.diff(new_depths) > 0), "Depths were not sorted"
+
+        for name, scale in [("log_a", 10.0), ("log_b", 20.0), ("log_c", 1.0)]:
+            values = well.get_data(name)[0].values
+            ind = ~np.isnan(values)
+            assert ind.sum() == (9 if name == "log_c" else 10)
+            np.testing.assert_array_almost_equal(values[ind], new_depths[ind] * scale)
@@ -0,0 +1,62 @@
+#  Copyright (c) 2021 Mira Geoscience Ltd.
+#
+#  This file is part of geoh5py.
+#
+#  geoh5py is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  geoh5py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from geoh5py.io import H5Writer
+from geoh5py.objects import Points
+from geoh5py.shared import fetch_h5_handle
+from geoh5py.workspace import Workspace
+
+
+def test_large_dataset_chunks():
+    rng = np.random.default_rng(0)
+    n_data = 200000
+    xyz = rng.standard_normal((n_data, 3))
+    values = rng.standard_normal(n_data)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        h5file_path = Path(tempdir) / r"testLarge.geoh5"
+        workspace = Workspace(h5file_path)
+        points = Points.create(workspace, vertices=xyz)
+        data = points.add_data({"DataValues": {"values": values}})
+        workspace.finalize()
+
+        with fetch_h5_handle(h5file_path) as h5file:
+            for entity, label, size in [
+                (points, "Vertices", xyz.nbytes),
+                (data, "Data", values.nbytes),
+            ]:
+                dataset = H5Writer.fetch_handle(h5file, entity)[label]
+                assert size > H5Writer.chunk_threshold
+                assert dataset.compression == "gzip", f"{label} is not compressed"
+                assert (
+                    dataset.chunks[0] * dataset.dtype.itemsize <= H5Writer.chunk_bytes
+                ), f"{label} chunks exceed the targeted size"
+                assert dataset.chunks[0] < n_data, f"{label} is stored in one chunk"
+
+        # Read the values back in from a fresh workspace
+        new_workspace = Workspace(h5file_path)
+        np.testing.assert_array_equal(
+            new_workspace.get_entity(points.uid)[0].vertices, xyz
+        )
+        np.testing.assert_array_equal(
+            new_workspace.get_entity(data.uid)[0].values, values
+        )
@@ -25,14 +25,14 @@ from geoh5py.workspace import Workspace
 
 
 def test_no_data_values():
-
+    rng = np.random.default_rng(0)
     # Generate a random cloud of points
     n_data = 12
-    xyz = np.random.randn(n_data, 3)
-    float_values = np.random.randn(n_data)
+    xyz = rng.standard_normal((n_data, 3))
+    float_values = rng.standard_normal(n_data)
     float_values[3:5] = np.nan
 
-    int_values = np.random.randint(n_data, size=n_data).astype(float)
+    int_values = rng.integers(n_data, size=n_data).astype(float)
     int_values[2:5] = np.nan
 
     all_nan = np.ones(n_data)
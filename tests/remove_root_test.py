@@ -27,26 +27,25 @@ from geoh5py.workspace import Workspace
 
 
 def test_remove_root():
-
-    # Generate a random cloud of points
+    rng = np.random.default_rng(0)
     n_data = 12
-    xyz = np.random.randn(n_data, 3)
 
     with tempfile.TemporaryDirectory() as tempdir:
         h5file_path = Path(tempdir) / r"testProject.geoh5"
 
         # Create a workspace
         workspace = Workspace(h5file_path)
-        points = Points.create(workspace, vertices=xyz)
+        # Generate a random cloud of points
+        points = Points.create(workspace, vertices=rng.standard_normal((n_data, 3)))
         data = points.add_data(
             {
                 "DataValues": {
                     "association": "VERTEX",
-                    "values": np.random.randn(n_data),
+                    "values": rng.standard_normal(n_data),
                 },
                 "DataValues2": {
                     "association": "VERTEX",
-                    "values": np.random.randn(n_data),
+                    "values": rng.standard_normal(n_data),
                 },
             }
         )
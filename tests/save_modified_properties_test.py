@@ -33,8 +33,9 @@ def test_save_modified_properties(
     write_coordinates,
     write_data_values,
 ):
+    rng = np.random.default_rng(0)
     n_data = 12
-    xyz = np.random.randn(n_data, 3)
+    xyz = rng.standard_normal((n_data, 3))
 
     with tempfile.TemporaryDirectory() as tempdir:
         h5file_path = Path(tempdir) / r"testPoints.geoh5"
@@ -26,9 +26,9 @@ from geoh5py.workspace import Workspace
 
 
 def test_set_parent():
-
+    rng = np.random.default_rng(0)
     # Generate a random cloud of points
-    xyz = np.random.randn(2, 3)
+    xyz = rng.standard_normal((2, 3))
     name = "test_points"
 
     with tempfile.TemporaryDirectory() as tempdir:
@@ -36,7 +36,7 @@ def test_set_parent():
         workspace = Workspace(h5file_path)
         group_a = ContainerGroup.create(workspace)
         entity = Points.create(workspace, vertices=xyz, name=name, parent=group_a)
-        entity.add_data({"random": {"values": np.random.randn(xyz.shape[0])}})
+        entity.add_data({"random": {"values": rng.standard_normal(xyz.shape[0])}})
         group_b = ContainerGroup.create(workspace, name="group_b")
         entity.parent = group_b
 